@@ -1,44 +1,93 @@
 import requests
+from requests.adapters import HTTPAdapter
+import base64
 import json
+import time
+from pathlib import Path
 
 BASE_URL = "http://localhost:8000"
 LOGIN_EMAIL = "testuser_1734892708@example.com" # Use the user created by previous script if possible, or register new
 PASSWORD = "password123"
+TOKEN_CACHE = Path.home() / ".airswift_token.json"
+
+# orjson is ~3-10x faster on nested payloads; fall back to stdlib json
+try:
+    import orjson
+    def dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def dumps(data):
+        return json.dumps(data, indent=2, default=str)
+
+# Shared session so login + list calls reuse one keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=10))
+SESSION.headers.update({"Content-Type": "application/json"})
+
+def jwt_expiry(token):
+    """Read the exp claim without verifying the signature"""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get("exp", 0)
+    except Exception:
+        return 0
+
+def load_cached_token():
+    try:
+        if TOKEN_CACHE.exists():
+            cached = json.loads(TOKEN_CACHE.read_text())
+            if cached.get("exp", 0) > time.time() + 30:
+                return cached["token"]
+    except Exception:
+        pass
+    return None
+
+def save_cached_token(token):
+    try:
+        TOKEN_CACHE.write_text(json.dumps({"token": token, "exp": jwt_expiry(token)}))
+    except Exception:
+        pass
 
 def check_data():
     print("🔍 Checking API Data...")
-    
-    # 1. Login to get token
+
+    # 1. Login to get token (reuse cached JWT if it hasn't expired)
     try:
-        # Try to login with a known test user, or create one if this fails
-        login_res = requests.post(f"{BASE_URL}/api/auth/login", json={"email": "admin@airswift.com", "password": "demo"})
-        
-        if login_res.status_code != 200:
-             # Fallback to the one created in reproduction script if admin doesn't exist (e.g. udaya1 db)
-             # Actually, best to just register a temp checker
-             email = f"checker_{int(str(id(object)))}@test.com"
-             requests.post(f"{BASE_URL}/api/auth/register", json={
-                 "email": email, "password": "password", "full_name": "Checker", "role": "hospital_staff", "hospital_id": "none"
-             })
-             login_res = requests.post(f"{BASE_URL}/api/auth/login", json={"email": email, "password": "password"})
-
-        if login_res.status_code != 200:
-            print(f"❌ Login Failed: {login_res.text}")
-            return
-
-        token = login_res.json()["access_token"]
-        print("✅ Login Successful")
+        token = load_cached_token()
+        if token:
+            print("✅ Using cached token")
+        else:
+            # Try to login with a known test user, or create one if this fails
+            login_res = SESSION.post(f"{BASE_URL}/api/auth/login", json={"email": "admin@airswift.com", "password": "demo"})
+
+            if login_res.status_code != 200:
+                 # Fallback to the one created in reproduction script if admin doesn't exist (e.g. udaya1 db)
+                 # Actually, best to just register a temp checker
+                 email = f"checker_{int(str(id(object)))}@test.com"
+                 SESSION.post(f"{BASE_URL}/api/auth/register", json={
+                     "email": email, "password": "password", "full_name": "Checker", "role": "hospital_staff", "hospital_id": "none"
+                 })
+                 login_res = SESSION.post(f"{BASE_URL}/api/auth/login", json={"email": email, "password": "password"})
+
+            if login_res.status_code != 200:
+                print(f"❌ Login Failed: {login_res.text}")
+                return
+
+            token = login_res.json()["access_token"]
+            save_cached_token(token)
+            print("✅ Login Successful")
 
         # 2. Get Patients
-        headers = {"Authorization": f"Bearer {token}"}
-        list_res = requests.get(f"{BASE_URL}/api/patients", headers=headers)
+        SESSION.headers["Authorization"] = f"Bearer {token}"
+        list_res = SESSION.get(f"{BASE_URL}/api/patients")
         
         if list_res.status_code == 200:
             patients = list_res.json()
             print(f"✅ Found {len(patients)} patients.")
             if len(patients) > 0:
                 print("First patient sample:")
-                print(json.dumps(patients[0], indent=2))
+                print(dumps(patients[0]))
         else:
              print(f"❌ List Failed: {list_res.status_code} {list_res.text}")
 
@@ -1,30 +1,91 @@
 from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from config import settings
 import certifi
+import os
+
+# One pool per worker process — with WEB_CONCURRENCY=N set
+# MONGO_MAX_POOL to (total Mongo connection budget) / N
+_POOL_OPTIONS = dict(
+    maxPoolSize=int(os.getenv("MONGO_MAX_POOL", "20")),
+    minPoolSize=5,
+    # Keep warm sockets around between traffic bursts instead of paying
+    # TLS + auth again a minute later
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=2000,
+    connectTimeoutMS=2000,
+    socketTimeoutMS=10000,
+    # zstd/snappy need the pymongo extras; the driver falls back to zlib
+    compressors="zstd,snappy,zlib",
+    retryWrites=True,
+    w="majority",
+)
 
 class MongoDB:
     client: MongoClient = None
+    async_client: AsyncIOMotorClient = None
+    database = None
+    async_database = None
+    collections = {}
+    async_collections = {}
 
 db = MongoDB()
 
-def connect_to_mongo():
+def connect_to_mongo(verify: bool = False):
+    # Client construction never touches the network — it only fails on a
+    # malformed URL. Build the handles first so collection accessors work
+    # even when Mongo itself is unreachable; the drivers reconnect on the
+    # first operation once it comes back.
     try:
-        db.client = MongoClient(settings.MONGODB_URL, tlsCAFile=certifi.where())
-        # Test the connection
-        db.client.admin.command('ping')
-        print("✅ Connected to MongoDB Atlas successfully!")
-        return True
+        db.client = MongoClient(
+            settings.MONGODB_URL,
+            tlsCAFile=certifi.where(),
+            **_POOL_OPTIONS,
+        )
+        # Async client for endpoints that must not block the event loop
+        db.async_client = AsyncIOMotorClient(
+            settings.MONGODB_URL,
+            tlsCAFile=certifi.where(),
+            **_POOL_OPTIONS,
+        )
+        # Cache the database handles so get_collection doesn't rebuild proxies
+        db.database = db.client[settings.DATABASE_NAME]
+        db.async_database = db.async_client[settings.DATABASE_NAME]
+        db.collections = {}
+        db.async_collections = {}
     except Exception as e:
-        print(f"❌ Failed to connect to MongoDB: {e}")
+        print(f"❌ Failed to configure MongoDB clients: {e}")
         return False
+    # Connections are established lazily on the first real operation, so
+    # only pay the extra ping round trip when a caller asks for it
+    if verify:
+        try:
+            db.client.admin.command('ping')
+        except Exception as e:
+            print(f"❌ MongoDB not reachable: {e}")
+            return False
+    print("✅ Connected to MongoDB Atlas successfully!")
+    return True
 
 def close_mongo_connection():
+    if db.async_client:
+        db.async_client.close()
     if db.client:
         db.client.close()
         print("Disconnected from MongoDB Atlas")
 
 def get_database():
-    return db.client[settings.DATABASE_NAME]
+    return db.database
 
 def get_collection(collection_name: str):
-    return get_database()[collection_name]
\ No newline at end of file
+    if db.database is None:
+        raise RuntimeError("MongoDB clients not initialized — call connect_to_mongo() first")
+    return db.collections.setdefault(collection_name, db.database[collection_name])
+
+def get_async_database():
+    return db.async_database
+
+def get_async_collection(collection_name: str):
+    if db.async_database is None:
+        raise RuntimeError("MongoDB clients not initialized — call connect_to_mongo() first")
+    return db.async_collections.setdefault(collection_name, db.async_database[collection_name])
@@ -18,12 +18,15 @@ def list_patients():
             count = bookings_coll.count_documents({})
             print(f"Total Bookings: {count}")
             if count > 0:
-                sample = bookings_coll.find_one()
-                print("Sample Booking:")
-                # Convert ObjectId to str for printing
-                sample["_id"] = str(sample["_id"])
-                if "patient_id" in sample: sample["patient_id"] = str(sample["patient_id"])
-                print(sample)
+                # Project only the fields we print — full booking docs are heavy.
+                # batch_size(1) keeps the driver from over-fetching a 101-doc batch
+                sample = next(bookings_coll.find({}, {"_id": 1, "patient_id": 1, "pickup_location": 1, "destination": 1, "status": 1}).limit(1).batch_size(1), None)
+                if sample:
+                    print("Sample Booking:")
+                    # Convert ObjectId to str for printing
+                    sample["_id"] = str(sample["_id"])
+                    if "patient_id" in sample: sample["patient_id"] = str(sample["patient_id"])
+                    print(sample)
         except Exception as e:
             print(f"Error reading bookings: {e}")
         patients_col = db["patients"]
@@ -33,7 +36,7 @@ def list_patients():
         
         if count > 0:
             print("\nLast 5 Patients:")
-            for p in patients_col.find().sort("_id", -1).limit(5):
+            for p in patients_col.find({}, {"full_name": 1, "created_by": 1}).sort("_id", -1).limit(5).batch_size(5):
                 print(f"- Name: {p.get('full_name')}, ID: {p.get('_id')}, CreatedBy: {p.get('created_by')}")
         else:
             print("❌ No patients found in the database.")
@@ -1,84 +1,360 @@
 from database.connection import get_collection
 from utils.auth import get_password_hash
 from models.user import UserRole
+from models.settings import DEFAULT_FLAGS
 from datetime import datetime
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import sys
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# bcrypt is ~100-300ms per call; cache repeat hashes across invocations
+hash_password = lru_cache(maxsize=32)(get_password_hash)
+
+# Built once so migrations and validation share the same object
+VALID_ROLES = frozenset(role.value for role in UserRole)
+
+# Module-level collection handles, bound once per process
+USERS = None
+SETTINGS = None
+PATIENTS = None
+BOOKINGS = None
+HOSPITALS = None
+AIRCRAFT = None
+
+def _bind_collections():
+    """Resolve all collection handles once instead of inside every helper"""
+    global USERS, SETTINGS, PATIENTS, BOOKINGS, HOSPITALS, AIRCRAFT
+    if USERS is None:
+        USERS = get_collection("users")
+        SETTINGS = get_collection("user_settings")
+        PATIENTS = get_collection("patients")
+        BOOKINGS = get_collection("bookings")
+        HOSPITALS = get_collection("hospitals")
+        AIRCRAFT = get_collection("aircraft")
+
+# ---------------------------------------------------
+# Static seed data — timestamps, hashes and runtime ids
+# are spliced in with a dict-merge at seeding time
+# ---------------------------------------------------
+SUPERADMIN_EMAIL = "superadmin@airambulance.com"
+SUPERADMIN_PASSWORD = "admin123"
+
+SAMPLE_USER_PASSWORDS = {
+    "dispatcher@airambulance.com": "dispatcher123",
+    "hospital@medical.com": "hospital123",
+    "pilot@airambulance.com": "pilot123",
+    "doctor@medical.com": "doctor123",
+    "paramedic@medical.com": "paramedic123",
+    "coordinator@airambulance.com": "coordinator123",
+}
+
+SAMPLE_USERS = (
+    {
+        "email": "dispatcher@airambulance.com",
+        "full_name": "John Dispatcher",
+        "phone": "+1234567891",
+        "role": UserRole.DISPATCHER,
+        "is_active": True,
+    },
+    {
+        "email": "hospital@medical.com",
+        "full_name": "Sarah Hospital Staff",
+        "phone": "+1234567892",
+        "role": UserRole.HOSPITAL_STAFF,
+        "is_active": True,
+    },
+    {
+        "email": "pilot@airambulance.com",
+        "full_name": "Mike Pilot",
+        "phone": "+1234567893",
+        "role": UserRole.PILOT,
+        "is_active": True,
+    },
+    {
+        "email": "doctor@medical.com",
+        "full_name": "Dr. Emily Chen",
+        "phone": "+1234567894",
+        "role": UserRole.DOCTOR,
+        "is_active": True,
+    },
+    {
+        "email": "paramedic@medical.com",
+        "full_name": "Alex Paramedic",
+        "phone": "+1234567895",
+        "role": UserRole.PARAMEDIC,
+        "is_active": True,
+    },
+    {
+        "email": "coordinator@airambulance.com",
+        "full_name": "Lisa Coordinator",
+        "phone": "+1234567896",
+        "role": UserRole.AIRLINE_COORDINATOR,
+        "is_active": True,
+    },
+)
+
+SAMPLE_PATIENTS = (
+    {
+        "full_name": "John Smith",
+        "date_of_birth": datetime(1985, 5, 15),
+        "gender": "male",
+        "medical_record_number": "MRN001",
+        "acuity_level": "critical",
+        "medical_conditions": ["Cardiac Arrest", "Hypertension"],
+        "allergies": ["Penicillin"],
+        "current_medications": ["Aspirin", "Beta Blocker"],
+        "emergency_contact": {
+            "name": "Jane Smith",
+            "relationship": "Spouse",
+            "phone": "+1234567890",
+            "email": "jane.smith@email.com"
+        },
+        "insurance_information": {
+            "provider": "HealthCare Plus",
+            "policy_number": "HCP123456",
+            "group_number": "GRP789"
+        },
+    },
+    {
+        "full_name": "Maria Garcia",
+        "date_of_birth": datetime(1978, 8, 22),
+        "gender": "female",
+        "medical_record_number": "MRN002",
+        "acuity_level": "urgent",
+        "medical_conditions": ["Pneumonia", "Diabetes"],
+        "allergies": ["Sulfa"],
+        "current_medications": ["Insulin", "Antibiotics"],
+        "emergency_contact": {
+            "name": "Carlos Garcia",
+            "relationship": "Husband",
+            "phone": "+1234567891",
+            "email": "carlos.garcia@email.com"
+        },
+        "insurance_information": {
+            "provider": "MediCare",
+            "policy_number": "MC654321",
+            "group_number": "GRP456"
+        },
+    },
+    {
+        "full_name": "Robert Johnson",
+        "date_of_birth": datetime(1992, 12, 3),
+        "gender": "male",
+        "medical_record_number": "MRN003",
+        "acuity_level": "stable",
+        "medical_conditions": ["Broken Leg", "Minor Concussion"],
+        "allergies": ["None"],
+        "current_medications": ["Pain Relievers"],
+        "emergency_contact": {
+            "name": "Lisa Johnson",
+            "relationship": "Sister",
+            "phone": "+1234567892",
+            "email": "lisa.johnson@email.com"
+        },
+        "insurance_information": {
+            "provider": "Blue Cross",
+            "policy_number": "BC987654",
+            "group_number": "GRP123"
+        },
+    },
+)
+
+SAMPLE_BOOKINGS = (
+    {
+        "pickup_location": "City General Hospital",
+        "destination": "Regional Trauma Center",
+        "urgency": "critical",
+        "required_equipment": ["Ventilator", "ECG Monitor", "Defibrillator"],
+        "special_instructions": "Patient requires continuous monitoring and ventilator support during transport",
+        "status": "pending",
+        "estimated_cost": 7500.00,
+        "actual_cost": None,
+        "flight_duration": None,
+        "assigned_aircraft_id": None,
+        "assigned_crew_ids": [],
+    },
+    {
+        "pickup_location": "Regional Trauma Center",
+        "destination": "City General Hospital",
+        "urgency": "urgent",
+        "required_equipment": ["ECG Monitor", "Oxygen Supply"],
+        "special_instructions": "Stable patient transfer for specialized care",
+        "status": "approved",
+        "estimated_cost": 4500.00,
+        "actual_cost": None,
+        "flight_duration": None,
+        "assigned_aircraft_id": None,
+        "assigned_crew_ids": [],
+    },
+)
+
+SAMPLE_HOSPITALS = (
+    {
+        "hospital_name": "City General Hospital",
+        "address": "123 Main Street, Cityville",
+        "latitude": 40.7128,
+        "longitude": -74.0060,
+        "level_of_care": "tertiary",
+        "icu_capacity": 50,
+        "contact_information": {
+            "name": "Dr. James Wilson",
+            "phone": "+1234567890",
+            "email": "james.wilson@citygeneral.com",
+            "position": "Medical Director"
+        },
+        "preferred_pickup_location": "Main Helipad - Roof Top",
+    },
+    {
+        "hospital_name": "Regional Trauma Center",
+        "address": "456 Oak Avenue, Townsville",
+        "latitude": 34.0522,
+        "longitude": -118.2437,
+        "level_of_care": "trauma_center",
+        "icu_capacity": 30,
+        "contact_information": {
+            "name": "Dr. Sarah Johnson",
+            "phone": "+1234567891",
+            "email": "sarah.johnson@traumacenter.com",
+            "position": "Emergency Department Head"
+        },
+        "preferred_pickup_location": "Emergency Department Helipad",
+    },
+)
+
+SAMPLE_AIRCRAFT = (
+    {
+        "aircraft_type": "helicopter",
+        "registration": "N123AB",
+        "airline_operator": "Air Ambulance Services",
+        "range_km": 600,
+        "speed_kmh": 250,
+        "max_payload_kg": 1200,
+        "cabin_configuration": "Medical - 1 patient, 2 medical staff",
+        "base_location": "City General Hospital",
+        "medical_equipment": [
+            {"name": "Ventilator", "quantity": 1, "operational": True},
+            {"name": "ECG Monitor", "quantity": 1, "operational": True},
+            {"name": "Defibrillator", "quantity": 1, "operational": True},
+            {"name": "Oxygen Supply", "quantity": 2, "operational": True}
+        ],
+        "status": "available",
+        "maintenance_records": [],
+    },
+    {
+        "aircraft_type": "fixed_wing",
+        "registration": "N456CD",
+        "airline_operator": "Air Ambulance Services",
+        "range_km": 1500,
+        "speed_kmh": 500,
+        "max_payload_kg": 2000,
+        "cabin_configuration": "Medical - 2 patients, 3 medical staff",
+        "base_location": "Regional Airport",
+        "medical_equipment": [
+            {"name": "Ventilator", "quantity": 2, "operational": True},
+            {"name": "ECG Monitor", "quantity": 2, "operational": True},
+            {"name": "Defibrillator", "quantity": 1, "operational": True},
+            {"name": "Oxygen Supply", "quantity": 4, "operational": True},
+            {"name": "Infusion Pump", "quantity": 2, "operational": True}
+        ],
+        "status": "available",
+        "maintenance_records": [],
+    },
+)
+
 def fix_existing_users():
     """Fix existing users with invalid roles"""
-    users_collection = get_collection("users")
-    
+    _bind_collections()
+
     # Update any users with 'clinician' role to 'doctor'
-    result = users_collection.update_many(
+    result = USERS.update_many(
         {"role": "clinician"},
         {"$set": {"role": UserRole.DOCTOR}}
     )
-    
+
     if result.modified_count > 0:
         print(f"✅ Fixed {result.modified_count} users with 'clinician' role")
-    
+
     # Update any other invalid roles to 'hospital_staff' as default
-    valid_roles = [role.value for role in UserRole]
-    users_collection.update_many(
-        {"role": {"$nin": valid_roles}},
+    USERS.update_many(
+        {"role": {"$nin": list(VALID_ROLES)}},
         {"$set": {"role": UserRole.HOSPITAL_STAFF}}
     )
 
 def initialize_settings_collection():
     """Initialize user settings collection with default settings for all users"""
     try:
-        settings_collection = get_collection("user_settings")
-        users_collection = get_collection("users")
-        
+        _bind_collections()
+
         print("🛠️ Initializing user settings...")
-        
+
+        now = datetime.utcnow()
+
         # Get all existing users
-        all_users = list(users_collection.find({}))
-        
-        settings_created = 0
+        all_users = list(USERS.find({}))
+        all_user_ids = [str(user["_id"]) for user in all_users]
+
+        # Create index for better performance (before the bulk insert so
+        # the unique index rejects duplicate user_ids server-side)
+        SETTINGS.create_index("user_id", unique=True)
+
+        # One query to find which users already have settings
+        existing_ids = {
+            doc["user_id"]
+            for doc in SETTINGS.find(
+                {"user_id": {"$in": all_user_ids}}, {"user_id": 1}
+            )
+        }
+
+        new_settings = []
+        messages = []
         for user in all_users:
             user_id = str(user["_id"])
-            
-            # Check if settings already exist for this user
-            existing_settings = settings_collection.find_one({"user_id": user_id})
-            
-            if not existing_settings:
+
+            if user_id not in existing_ids:
                 # Create default settings for user
-                default_settings = {
+                new_settings.append({
                     "user_id": user_id,
                     "theme": "light",
                     "time_format": "12h",
                     "date_format": "MM/DD/YYYY",
                     "timezone": "UTC",
                     "language": "en",
-                    "notifications_enabled": True,
-                    "email_notifications": True,
-                    "sms_notifications": False,
-                    "push_notifications": True,
-                    "browser_notifications": True,
-                    "notify_booking_updates": True,
-                    "notify_emergency_alerts": True,
-                    "notify_system_maintenance": False,
-                    "notify_promotions": False,
+                    # Notification booleans live in one bitmask (see models.settings)
+                    "flags": DEFAULT_FLAGS,
                     "email_digest_frequency": "daily",
-                    "created_at": datetime.utcnow(),
-                    "updated_at": datetime.utcnow()
-                }
-                
-                settings_collection.insert_one(default_settings)
-                settings_created += 1
-                print(f"   ✅ Created settings for user: {user['email']}")
-        
-        # Create index for better performance
-        settings_collection.create_index("user_id", unique=True)
-        
+                    "created_at": now,
+                    "updated_at": now
+                })
+                messages.append(f"   ✅ Created settings for user: {user['email']}")
+
+        # Single bulk insert instead of one round trip per user, then one
+        # buffered write for the per-user messages. Concurrent workers
+        # race this at boot, so duplicate keys from the losers are
+        # expected — tolerate code 11000 like the other seeders.
+        skipped = set()
+        if new_settings:
+            try:
+                SETTINGS.insert_many(new_settings, ordered=False)
+            except BulkWriteError as e:
+                non_duplicate = [w for w in e.details["writeErrors"] if w["code"] != 11000]
+                if non_duplicate:
+                    raise
+                skipped = {w["index"] for w in e.details["writeErrors"]}
+            kept = [m for i, m in enumerate(messages) if i not in skipped]
+            if kept:
+                sys.stdout.write("\n".join(kept) + "\n")
+        settings_created = len(new_settings) - len(skipped)
+
         print(f"✅ Settings initialization completed: {settings_created} settings created")
         return settings_created
-        
+
     except Exception as e:
         print(f"❌ Error initializing settings collection: {e}")
         return 0
@@ -86,90 +362,38 @@ def initialize_settings_collection():
 def initialize_sample_patients():
     """Initialize sample patients for testing"""
     try:
-        patients_collection = get_collection("patients")
-        
+        _bind_collections()
+
+        now = datetime.utcnow()
         sample_patients = [
-            {
-                "full_name": "John Smith",
-                "date_of_birth": datetime(1985, 5, 15),
-                "gender": "male",
-                "medical_record_number": "MRN001",
-                "acuity_level": "critical",
-                "medical_conditions": ["Cardiac Arrest", "Hypertension"],
-                "allergies": ["Penicillin"],
-                "current_medications": ["Aspirin", "Beta Blocker"],
-                "emergency_contact": {
-                    "name": "Jane Smith",
-                    "relationship": "Spouse",
-                    "phone": "+1234567890",
-                    "email": "jane.smith@email.com"
-                },
-                "insurance_information": {
-                    "provider": "HealthCare Plus",
-                    "policy_number": "HCP123456",
-                    "group_number": "GRP789"
-                },
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            },
-            {
-                "full_name": "Maria Garcia",
-                "date_of_birth": datetime(1978, 8, 22),
-                "gender": "female",
-                "medical_record_number": "MRN002",
-                "acuity_level": "urgent",
-                "medical_conditions": ["Pneumonia", "Diabetes"],
-                "allergies": ["Sulfa"],
-                "current_medications": ["Insulin", "Antibiotics"],
-                "emergency_contact": {
-                    "name": "Carlos Garcia",
-                    "relationship": "Husband",
-                    "phone": "+1234567891",
-                    "email": "carlos.garcia@email.com"
-                },
-                "insurance_information": {
-                    "provider": "MediCare",
-                    "policy_number": "MC654321",
-                    "group_number": "GRP456"
-                },
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            },
-            {
-                "full_name": "Robert Johnson",
-                "date_of_birth": datetime(1992, 12, 3),
-                "gender": "male",
-                "medical_record_number": "MRN003",
-                "acuity_level": "stable",
-                "medical_conditions": ["Broken Leg", "Minor Concussion"],
-                "allergies": ["None"],
-                "current_medications": ["Pain Relievers"],
-                "emergency_contact": {
-                    "name": "Lisa Johnson",
-                    "relationship": "Sister",
-                    "phone": "+1234567892",
-                    "email": "lisa.johnson@email.com"
-                },
-                "insurance_information": {
-                    "provider": "Blue Cross",
-                    "policy_number": "BC987654",
-                    "group_number": "GRP123"
-                },
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
+            {**patient, "created_at": now, "updated_at": now}
+            for patient in SAMPLE_PATIENTS
+        ]
+
+        # Let the unique index reject duplicates server-side instead of
+        # paying an existence query first
+        PATIENTS.create_index("medical_record_number", unique=True)
+        try:
+            PATIENTS.insert_many(sample_patients, ordered=False)
+            skipped = set()
+        except BulkWriteError as e:
+            non_duplicate = [w for w in e.details["writeErrors"] if w["code"] != 11000]
+            if non_duplicate:
+                raise
+            skipped = {w["index"] for w in e.details["writeErrors"]}
+
+        created = [
+            patient_data["full_name"]
+            for index, patient_data in enumerate(sample_patients)
+            if index not in skipped
         ]
-        
-        patients_created = 0
-        for patient_data in sample_patients:
-            if not patients_collection.find_one({"medical_record_number": patient_data["medical_record_number"]}):
-                patients_collection.insert_one(patient_data)
-                patients_created += 1
-                print(f"✅ Patient created: {patient_data['full_name']}")
-        
+        patients_created = len(created)
+        if created:
+            sys.stdout.write("".join(f"✅ Patient created: {name}\n" for name in created))
+
         print(f"✅ Sample patients initialization completed: {patients_created} patients created")
         return patients_created
-        
+
     except Exception as e:
         print(f"❌ Error initializing sample patients: {e}")
         return 0
@@ -177,305 +401,223 @@ def initialize_sample_patients():
 def initialize_sample_bookings():
     """Initialize sample bookings for testing"""
     try:
-        bookings_collection = get_collection("bookings")
-        patients_collection = get_collection("patients")
-        users_collection = get_collection("users")
-        
+        _bind_collections()
+
         # Get sample patient and user IDs
-        sample_patient = patients_collection.find_one({"medical_record_number": "MRN001"})
-        hospital_staff = users_collection.find_one({"email": "hospital@medical.com"})
-        
+        sample_patient = PATIENTS.find_one({"medical_record_number": "MRN001"})
+        hospital_staff = USERS.find_one({"email": "hospital@medical.com"})
+
         if not sample_patient or not hospital_staff:
             print("❌ Sample patient or hospital staff not found for booking creation")
             return 0
-        
+
+        now = datetime.utcnow()
         sample_bookings = [
             {
+                **booking,
                 "patient_id": str(sample_patient["_id"]),
-                "pickup_location": "City General Hospital",
-                "destination": "Regional Trauma Center",
-                "urgency": "critical",
-                "required_equipment": ["Ventilator", "ECG Monitor", "Defibrillator"],
-                "special_instructions": "Patient requires continuous monitoring and ventilator support during transport",
-                "status": "pending",
-                "estimated_cost": 7500.00,
-                "actual_cost": None,
-                "flight_duration": None,
-                "assigned_aircraft_id": None,
-                "assigned_crew_ids": [],
                 "created_by": str(hospital_staff["_id"]),
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            },
-            {
-                "patient_id": str(sample_patient["_id"]),
-                "pickup_location": "Regional Trauma Center",
-                "destination": "City General Hospital",
-                "urgency": "urgent",
-                "required_equipment": ["ECG Monitor", "Oxygen Supply"],
-                "special_instructions": "Stable patient transfer for specialized care",
-                "status": "approved",
-                "estimated_cost": 4500.00,
-                "actual_cost": None,
-                "flight_duration": None,
-                "assigned_aircraft_id": None,
-                "assigned_crew_ids": [],
-                "created_by": str(hospital_staff["_id"]),
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
+                "created_at": now,
+                "updated_at": now
             }
+            for booking in SAMPLE_BOOKINGS
+        ]
+
+        # Back the duplicate check with a compound index so it never falls
+        # back to a collection scan
+        BOOKINGS.create_index([
+            ("patient_id", 1), ("pickup_location", 1), ("created_at", -1)
+        ])
+
+        # Find today's similar bookings in one query instead of one per booking
+        existing_keys = {
+            (doc["patient_id"], doc["pickup_location"])
+            for doc in BOOKINGS.find({
+                "patient_id": str(sample_patient["_id"]),
+                "pickup_location": {"$in": [b["pickup_location"] for b in sample_bookings]},
+                "created_at": {"$gte": now.replace(hour=0, minute=0, second=0, microsecond=0)}
+            }, {"patient_id": 1, "pickup_location": 1})
+        }
+
+        new_bookings = [
+            b for b in sample_bookings
+            if (b["patient_id"], b["pickup_location"]) not in existing_keys
         ]
-        
-        bookings_created = 0
-        for booking_data in sample_bookings:
-            # Check if similar booking already exists
-            existing_booking = bookings_collection.find_one({
-                "patient_id": booking_data["patient_id"],
-                "pickup_location": booking_data["pickup_location"],
-                "created_at": {"$gte": datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)}
-            })
-            
-            if not existing_booking:
-                bookings_collection.insert_one(booking_data)
-                bookings_created += 1
-                print(f"✅ Booking created: {booking_data['pickup_location']} → {booking_data['destination']}")
-        
+        if new_bookings:
+            BOOKINGS.insert_many(new_bookings, ordered=False)
+            sys.stdout.write("".join(
+                f"✅ Booking created: {b['pickup_location']} → {b['destination']}\n"
+                for b in new_bookings
+            ))
+        bookings_created = len(new_bookings)
+
         print(f"✅ Sample bookings initialization completed: {bookings_created} bookings created")
         return bookings_created
-        
+
     except Exception as e:
         print(f"❌ Error initializing sample bookings: {e}")
         return 0
 
 def initialize_database():
     print("🚀 Initializing database with default data...")
-    
+
+    _bind_collections()
+
+    now = datetime.utcnow()
+
+    # Hot-path indexes: every auth call looks users up by email, the
+    # recipient fan-out filters on (role, is_active), and the aircraft
+    # endpoints filter/count on status — keep all three off COLLSCAN
+    USERS.create_index("email", unique=True)
+    USERS.create_index([("role", 1), ("is_active", 1)])
+    AIRCRAFT.create_index("status")
+    # Covers the /pending/count count_documents and the status-filtered
+    # list with its created_at sort in one index
+    BOOKINGS.create_index([("status", 1), ("created_at", -1)])
+    # Dashboard query shapes: HOSPITAL_STAFF stats scope everything to
+    # created_by, the activity feeds sort on updated_at, and transfers
+    # filter completed bookings by recency. count_documents with a
+    # predicate never uses a covered count, so each needs its index.
+    BOOKINGS.create_index([("created_by", 1), ("status", 1)])
+    BOOKINGS.create_index([("created_by", 1), ("urgency", 1)])
+    BOOKINGS.create_index([("created_by", 1), ("created_at", -1)])
+    BOOKINGS.create_index([("created_by", 1), ("updated_at", -1)])
+    BOOKINGS.create_index([("status", 1), ("updated_at", -1)])
+    PATIENTS.create_index("acuity_level")
+
     # First, fix any existing users with invalid roles
     fix_existing_users()
-    
+
+    # Hash all default passwords in parallel (bcrypt releases the GIL)
+    default_passwords = [SUPERADMIN_PASSWORD] + list(SAMPLE_USER_PASSWORDS.values())
+    with ThreadPoolExecutor(max_workers=len(default_passwords)) as executor:
+        hashes = dict(zip(default_passwords, executor.map(hash_password, default_passwords)))
+
     # Create superadmin user if not exists
-    users_collection = get_collection("users")
-    
-    superadmin_email = "superadmin@airambulance.com"
-    if not users_collection.find_one({"email": superadmin_email}):
+    if not USERS.find_one({"email": SUPERADMIN_EMAIL}):
         superadmin_data = {
-            "email": superadmin_email,
+            "email": SUPERADMIN_EMAIL,
             "full_name": "Super Administrator",
             "phone": "+1234567890",
             "role": UserRole.SUPERADMIN,
             "is_active": True,
-            "hashed_password": get_password_hash("admin123"),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "hashed_password": hashes[SUPERADMIN_PASSWORD],
+            "created_at": now,
+            "updated_at": now
         }
-        users_collection.insert_one(superadmin_data)
+        USERS.insert_one(superadmin_data)
         print("✅ Superadmin user created:")
-        print(f"   Email: {superadmin_email}")
-        print(f"   Password: admin123")
+        print(f"   Email: {SUPERADMIN_EMAIL}")
+        print(f"   Password: {SUPERADMIN_PASSWORD}")
     else:
         print("✅ Superadmin user already exists")
-    
+
     # Create some sample roles for testing
     sample_users = [
         {
-            "email": "dispatcher@airambulance.com",
-            "full_name": "John Dispatcher",
-            "phone": "+1234567891",
-            "role": UserRole.DISPATCHER,
-            "is_active": True,
-            "hashed_password": get_password_hash("dispatcher123"),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "email": "hospital@medical.com",
-            "full_name": "Sarah Hospital Staff",
-            "phone": "+1234567892",
-            "role": UserRole.HOSPITAL_STAFF,
-            "is_active": True,
-            "hashed_password": get_password_hash("hospital123"),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "email": "pilot@airambulance.com",
-            "full_name": "Mike Pilot",
-            "phone": "+1234567893",
-            "role": UserRole.PILOT,
-            "is_active": True,
-            "hashed_password": get_password_hash("pilot123"),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "email": "doctor@medical.com",
-            "full_name": "Dr. Emily Chen",
-            "phone": "+1234567894",
-            "role": UserRole.DOCTOR,
-            "is_active": True,
-            "hashed_password": get_password_hash("doctor123"),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "email": "paramedic@medical.com",
-            "full_name": "Alex Paramedic",
-            "phone": "+1234567895",
-            "role": UserRole.PARAMEDIC,
-            "is_active": True,
-            "hashed_password": get_password_hash("paramedic123"),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "email": "coordinator@airambulance.com",
-            "full_name": "Lisa Coordinator",
-            "phone": "+1234567896",
-            "role": UserRole.AIRLINE_COORDINATOR,
-            "is_active": True,
-            "hashed_password": get_password_hash("coordinator123"),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            **user,
+            "hashed_password": hashes[SAMPLE_USER_PASSWORDS[user["email"]]],
+            "created_at": now,
+            "updated_at": now
         }
+        for user in SAMPLE_USERS
     ]
-    
-    for user_data in sample_users:
-        if not users_collection.find_one({"email": user_data["email"]}):
-            users_collection.insert_one(user_data)
-            print(f"✅ {user_data['role']} user created: {user_data['email']}")
-        else:
-            # Update existing user to ensure correct role
-            users_collection.update_one(
-                {"email": user_data["email"]},
-                {"$set": {"role": user_data["role"]}}
-            )
-            print(f"✅ {user_data['role']} user updated: {user_data['email']}")
-    
+
+    # One query for existing emails, then one bulk insert and one bulk role update
+    sample_emails = [u["email"] for u in sample_users]
+    existing_emails = {
+        doc["email"]
+        for doc in USERS.find({"email": {"$in": sample_emails}}, {"email": 1})
+    }
+
+    new_users = [u for u in sample_users if u["email"] not in existing_emails]
+    if new_users:
+        USERS.insert_many(new_users, ordered=False)
+        sys.stdout.write("".join(
+            f"✅ {u['role']} user created: {u['email']}\n" for u in new_users
+        ))
+
+    # Update existing users to ensure correct roles
+    role_updates = [
+        UpdateOne({"email": u["email"]}, {"$set": {"role": u["role"]}})
+        for u in sample_users if u["email"] in existing_emails
+    ]
+    if role_updates:
+        USERS.bulk_write(role_updates, ordered=False)
+        sys.stdout.write("".join(
+            f"✅ {u['role']} user updated: {u['email']}\n"
+            for u in sample_users if u["email"] in existing_emails
+        ))
+
     # Create sample hospitals
-    hospitals_collection = get_collection("hospitals")
     sample_hospitals = [
-        {
-            "hospital_name": "City General Hospital",
-            "address": "123 Main Street, Cityville",
-            "latitude": 40.7128,
-            "longitude": -74.0060,
-            "level_of_care": "tertiary",
-            "icu_capacity": 50,
-            "contact_information": {
-                "name": "Dr. James Wilson",
-                "phone": "+1234567890",
-                "email": "james.wilson@citygeneral.com",
-                "position": "Medical Director"
-            },
-            "preferred_pickup_location": "Main Helipad - Roof Top",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        },
-        {
-            "hospital_name": "Regional Trauma Center",
-            "address": "456 Oak Avenue, Townsville",
-            "latitude": 34.0522,
-            "longitude": -118.2437,
-            "level_of_care": "trauma_center",
-            "icu_capacity": 30,
-            "contact_information": {
-                "name": "Dr. Sarah Johnson",
-                "phone": "+1234567891",
-                "email": "sarah.johnson@traumacenter.com",
-                "position": "Emergency Department Head"
-            },
-            "preferred_pickup_location": "Emergency Department Helipad",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        }
+        {**hospital, "created_at": now, "updated_at": now}
+        for hospital in SAMPLE_HOSPITALS
     ]
-    
-    for hospital_data in sample_hospitals:
-        if not hospitals_collection.find_one({"hospital_name": hospital_data["hospital_name"]}):
-            hospitals_collection.insert_one(hospital_data)
-            print(f"✅ Hospital created: {hospital_data['hospital_name']}")
-    
+
+    HOSPITALS.create_index("hospital_name", unique=True)
+    try:
+        HOSPITALS.insert_many(sample_hospitals, ordered=False)
+        skipped = set()
+    except BulkWriteError as e:
+        non_duplicate = [w for w in e.details["writeErrors"] if w["code"] != 11000]
+        if non_duplicate:
+            raise
+        skipped = {w["index"] for w in e.details["writeErrors"]}
+    sys.stdout.write("".join(
+        f"✅ Hospital created: {h['hospital_name']}\n"
+        for index, h in enumerate(sample_hospitals) if index not in skipped
+    ))
+
     # Create sample aircraft
-    aircraft_collection = get_collection("aircraft")
     sample_aircraft = [
-        {
-            "aircraft_type": "helicopter",
-            "registration": "N123AB",
-            "airline_operator": "Air Ambulance Services",
-            "range_km": 600,
-            "speed_kmh": 250,
-            "max_payload_kg": 1200,
-            "cabin_configuration": "Medical - 1 patient, 2 medical staff",
-            "base_location": "City General Hospital",
-            "medical_equipment": [
-                {"name": "Ventilator", "quantity": 1, "operational": True},
-                {"name": "ECG Monitor", "quantity": 1, "operational": True},
-                {"name": "Defibrillator", "quantity": 1, "operational": True},
-                {"name": "Oxygen Supply", "quantity": 2, "operational": True}
-            ],
-            "status": "available",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
-            "maintenance_records": []
-        },
-        {
-            "aircraft_type": "fixed_wing",
-            "registration": "N456CD",
-            "airline_operator": "Air Ambulance Services",
-            "range_km": 1500,
-            "speed_kmh": 500,
-            "max_payload_kg": 2000,
-            "cabin_configuration": "Medical - 2 patients, 3 medical staff",
-            "base_location": "Regional Airport",
-            "medical_equipment": [
-                {"name": "Ventilator", "quantity": 2, "operational": True},
-                {"name": "ECG Monitor", "quantity": 2, "operational": True},
-                {"name": "Defibrillator", "quantity": 1, "operational": True},
-                {"name": "Oxygen Supply", "quantity": 4, "operational": True},
-                {"name": "Infusion Pump", "quantity": 2, "operational": True}
-            ],
-            "status": "available",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
-            "maintenance_records": []
-        }
+        {**aircraft, "created_at": now, "updated_at": now}
+        for aircraft in SAMPLE_AIRCRAFT
     ]
-    
-    for aircraft_data in sample_aircraft:
-        if not aircraft_collection.find_one({"registration": aircraft_data["registration"]}):
-            aircraft_collection.insert_one(aircraft_data)
-            print(f"✅ Aircraft created: {aircraft_data['registration']}")
-    
+
+    AIRCRAFT.create_index("registration", unique=True)
+    try:
+        AIRCRAFT.insert_many(sample_aircraft, ordered=False)
+        skipped = set()
+    except BulkWriteError as e:
+        non_duplicate = [w for w in e.details["writeErrors"] if w["code"] != 11000]
+        if non_duplicate:
+            raise
+        skipped = {w["index"] for w in e.details["writeErrors"]}
+    sys.stdout.write("".join(
+        f"✅ Aircraft created: {a['registration']}\n"
+        for index, a in enumerate(sample_aircraft) if index not in skipped
+    ))
+
     # Initialize sample patients
     # initialize_sample_patients()
-    
+
     # Initialize sample bookings
     # initialize_sample_bookings()
-    
+
     # Initialize user settings for all users
     initialize_settings_collection()
-    
+
     print("🎉 Database initialization completed!")
 
 def reset_user_settings(user_email: str = None):
     """Reset settings for a specific user or all users"""
-    settings_collection = get_collection("user_settings")
-    users_collection = get_collection("users")
-    
+    _bind_collections()
+
     if user_email:
         # Reset settings for specific user
-        user = users_collection.find_one({"email": user_email})
+        user = USERS.find_one({"email": user_email})
         if user:
             user_id = str(user["_id"])
-            settings_collection.delete_one({"user_id": user_id})
+            SETTINGS.delete_one({"user_id": user_id})
             print(f"✅ Settings reset for user: {user_email}")
         else:
             print(f"❌ User not found: {user_email}")
     else:
         # Reset all settings
-        result = settings_collection.delete_many({})
+        result = SETTINGS.delete_many({})
         print(f"✅ Reset all user settings: {result.deleted_count} settings deleted")
-        
+
         # Reinitialize settings
         initialize_settings_collection()
 
@@ -484,4 +626,4 @@ if __name__ == "__main__":
     if connect_to_mongo():
         initialize_database()
     else:
-        print("❌ Failed to connect to database")
\ No newline at end of file
+        print("❌ Failed to connect to database")
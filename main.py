@@ -1,41 +1,100 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 from datetime import datetime
+import asyncio
+import orjson
+import os
+import sys
+import time
 import uvicorn
 
 from database.connection import connect_to_mongo, close_mongo_connection, db
-from init_db import initialize_database
-
-from routes import (
-    auth,
-    users,
-    patients,
-    hospitals,
-    aircraft,
-    bookings,
-    reports,
-    dashboard,
-    settings,
-    notifications,
-    hospital_staff,
+
+# Set once the deferred startup work (DB seeding) has finished
+READY = asyncio.Event()
+
+# Routers are imported lazily in lifespan so the module graph (Pydantic
+# models, report/notification helpers, ...) isn't parsed before uvicorn
+# can bind the socket
+ROUTE_MODULES = (
+    "auth",
+    "users",
+    "patients",
+    "hospitals",
+    "aircraft",
+    "bookings",
+    "reports",
+    "hospital_staff",
+    "dashboard",
+    "settings",
+    "notifications",
+    "batch",
 )
 
+def include_routers(app: FastAPI):
+    import importlib
+    for name in ROUTE_MODULES:
+        app.include_router(importlib.import_module(f"routes.{name}").router)
+
 # ---------------------------------------------------
 # Lifespan (Startup & Shutdown)
 # ---------------------------------------------------
+def _warm_routes(app: FastAPI):
+    # FastAPI builds handler closures and pydantic-core schemas lazily on
+    # first hit; materialize them here so no request pays that cost
+    from fastapi.routing import APIRoute
+    from pydantic import TypeAdapter
+
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            route.get_route_handler()
+            if route.response_model is not None:
+                try:
+                    TypeAdapter(route.response_model).json_schema()
+                except Exception:
+                    pass
+
+
+async def _deferred_init(app: FastAPI):
+    # Database seeding is blocking PyMongo work — keep it off the event
+    # loop and off the socket-bind critical path
+    from init_db import initialize_database
+    await asyncio.to_thread(initialize_database)
+    await asyncio.to_thread(_warm_routes, app)
+    print_routes(app)
+    app.state.debug_routes_payload = _build_routes_payload(app)
+    READY.set()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🚀 Starting Air Ambulance Management System...")
-    if connect_to_mongo():
-        initialize_database()
-        print_routes(app)
-        yield
-        close_mongo_connection()
-        print("👋 Shutting down Air Ambulance Management System...")
-    else:
-        print("❌ MongoDB connection failed")
-        yield
+    # connect_to_mongo constructs the (lazily connecting) clients even
+    # when the verify ping fails, so routers can always bind their
+    # collection handles; operations recover once Mongo is reachable.
+    # Registering no routes on a failed ping would pin the app in a
+    # 404-everything state until a manual restart.
+    connected = connect_to_mongo(verify=True)
+    if not connected:
+        print("⚠️ MongoDB unreachable at startup — serving routes anyway; "
+              "operations retry once it returns")
+    include_routers(app)
+    from utils.notification_queue import start_worker, stop_worker
+    from routes.bookings import manager as bookings_ws_manager
+    start_worker()
+    await bookings_ws_manager.start_pubsub()
+    # Seeding needs a live connection; /health/ready stays 503 until it
+    # has run, which tells the orchestrator this instance needs a look
+    init_task = asyncio.create_task(_deferred_init(app)) if connected else None
+    yield
+    if init_task is not None:
+        init_task.cancel()
+    await bookings_ws_manager.stop_pubsub()
+    await stop_worker()
+    close_mongo_connection()
+    print("👋 Shutting down Air Ambulance Management System...")
 
 
 # ---------------------------------------------------
@@ -46,80 +105,119 @@ app = FastAPI(
     description="Comprehensive backend for air ambulance operations management",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson serializes dicts with datetimes/enums natively, well ahead
+    # of the stdlib encoder FastAPI uses by default
+    default_response_class=ORJSONResponse,
 )
 
 # ---------------------------------------------------
 # ✅ CORS Middleware (FIXED)
 # ---------------------------------------------------
+# One compiled regex instead of scanning an origin list per request. The
+# old list's "*" entry was dead weight anyway — browsers reject wildcard
+# origins combined with credentials. Private-network ranges keep dev
+# setups with dynamic IPs working.
+CORS_ORIGIN_REGEX = (
+    r"^(https?://localhost(:\d+)?"
+    r"|https?://127\.0\.0\.1(:\d+)?"
+    r"|https?://10\.\d+\.\d+\.\d+(:\d+)?"
+    r"|https?://172\.(1[6-9]|2\d|3[01])\.\d+\.\d+(:\d+)?"
+    r"|https?://192\.168\.\d+\.\d+(:\d+)?"
+    r"|https://([a-z0-9-]+\.)?onrender\.com)$"
+)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:5174",
-        "*", # Allow all origins for development to fix CORS issues with dynamic IPs
-        "http://10.214.79.226:8080",
-        "http://10.124.178.119:5173",
-        "http://172.21.224.1:5173",
-        "https://moviecloud-airambulanc.onrender.com",
-        "https://*.onrender.com",
-    ],
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# ---------------------------------------------------
-# Routers
-# ---------------------------------------------------
-app.include_router(auth.router)
-app.include_router(users.router)
-app.include_router(patients.router)
-app.include_router(hospitals.router)
-app.include_router(aircraft.router)
-app.include_router(bookings.router)
-app.include_router(reports.router)
-app.include_router(hospital_staff.router)
-app.include_router(dashboard.router)
-app.include_router(settings.router)
-app.include_router(notifications.router)
-
 # ---------------------------------------------------
 # Root Endpoint
 # ---------------------------------------------------
-@app.get("/")
-async def root():
-    return {
+# The payload never changes, so serialize it exactly once at import —
+# load balancers hit this constantly and shouldn't pay JSON encoding
+_ROOT_RESPONSE = ORJSONResponse(
+    {
         "message": "Air Ambulance Management System API",
         "version": "1.0.0",
         "docs": "/docs",
         "status": "running",
     }
+)
+
+@app.get("/")
+async def root():
+    return _ROOT_RESPONSE
 
 # ---------------------------------------------------
 # Health Check
 # ---------------------------------------------------
+# Health timestamps only need 1s resolution — cache the ISO string so
+# load-balancer polling doesn't re-format it on every request
+_ts_cache = ["", 0.0]
+
+def now_iso() -> str:
+    t = time.time()
+    if t - _ts_cache[1] >= 1.0:
+        _ts_cache[0] = datetime.utcfromtimestamp(t).isoformat()
+        _ts_cache[1] = t
+    return _ts_cache[0]
+
+# Last known DB status, reused for 5s so load-balancer polling doesn't
+# storm Mongo with pings
+_db_status_cache = {"status": None, "checked_at": 0.0}
+
 @app.get("/health")
 async def health_check():
-    try:
-        if db.client:
-            db.client.admin.command("ping")
-            db_status = "connected"
-        else:
-            db_status = "disconnected"
-    except Exception:
-        db_status = "error"
+    now = time.monotonic()
+    if _db_status_cache["status"] and now - _db_status_cache["checked_at"] < 5:
+        db_status = _db_status_cache["status"]
+    else:
+        try:
+            if db.async_client is not None:
+                # Motor ping keeps the event loop free for other requests
+                await asyncio.wait_for(
+                    db.async_client.admin.command("ping"), timeout=1.0
+                )
+                db_status = "connected"
+            else:
+                db_status = "disconnected"
+        except Exception:
+            db_status = "error"
+        _db_status_cache["status"] = db_status
+        _db_status_cache["checked_at"] = now
 
-    return {
-        "status": "healthy",
-        "database": db_status,
-        "timestamp": datetime.utcnow().isoformat(),
-    }
+    # Hand back raw orjson bytes so FastAPI skips its encoder entirely
+    return Response(
+        content=orjson.dumps(
+            {
+                "status": "healthy",
+                "database": db_status,
+                "timestamp": now_iso(),
+            }
+        ),
+        media_type="application/json",
+    )
+
+@app.get("/health/live")
+async def liveness_check():
+    # Always 200 once the socket is bound — orchestrators poll this
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    # 503 until the deferred startup work has completed
+    if not READY.is_set():
+        return JSONResponse(status_code=503, content={"status": "initializing"})
+    return {"status": "ready"}
 
 # ---------------------------------------------------
 # Debug Routes
 # ---------------------------------------------------
-@app.get("/debug/routes")
-async def debug_routes():
+def _build_routes_payload(app: FastAPI):
     return {
         "total_routes": len(app.routes),
         "routes": [
@@ -133,16 +231,28 @@ async def debug_routes():
         ],
     }
 
+@app.get("/debug/routes")
+async def debug_routes():
+    # The route table is immutable after startup, so build the payload once
+    payload = getattr(app.state, "debug_routes_payload", None)
+    if payload is None:
+        payload = app.state.debug_routes_payload = _build_routes_payload(app)
+    return payload
+
 # ---------------------------------------------------
 # Utility: Print Routes
 # ---------------------------------------------------
 def print_routes(app: FastAPI):
-    print("\n📋 REGISTERED ROUTES")
-    print("=" * 50)
-    for route in app.routes:
-        if hasattr(route, "methods"):
-            print(f"{', '.join(route.methods):15} {route.path}")
-    print("=" * 50)
+    # Emit the whole table as one write instead of one flush per route
+    lines = ["\n📋 REGISTERED ROUTES", "=" * 50]
+    lines.extend(
+        f"{', '.join(route.methods):15} {route.path}"
+        for route in app.routes
+        if hasattr(route, "methods")
+    )
+    lines.append("=" * 50)
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 # ---------------------------------------------------
 # Run Server (Local)
@@ -152,6 +262,14 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        # uvicorn silently ignores `workers` whenever reload is on, so
+        # auto-reload is opt-in for local dev and off by default to let
+        # WEB_CONCURRENCY actually fan out processes
+        reload=os.getenv("UVICORN_RELOAD", "").lower() in ("1", "true"),
         log_level="info",
+        # uvloop + httptools dispatch socket events in C instead of the
+        # pure-Python selector loop (uvloop is not available on Windows)
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
     )
@@ -0,0 +1,31 @@
+from enum import Enum
+
+
+class ValueLookupEnum(str, Enum):
+    """Base for the string enums used across the models.
+
+    ``Enum(value)`` misses fall through to a linear scan of the members
+    before raising; ``_missing_`` short-circuits that with a value ->
+    member dict built on first use. ``lookup`` gives hot call sites the
+    same one-hash-get resolution without ``Enum.__call__`` overhead::
+
+        status = BookingStatus.lookup(raw)   # member, or None
+    """
+
+    @classmethod
+    def _missing_(cls, value):
+        return cls._value_map().get(value)
+
+    @classmethod
+    def lookup(cls, value):
+        return cls._value_map().get(value)
+
+    @classmethod
+    def _value_map(cls):
+        # Built lazily because Enum members don't exist yet while the
+        # class body (and __init_subclass__) run on Python 3.10
+        value_map = cls.__dict__.get("_LOOKUP")
+        if value_map is None:
+            value_map = {member.value: member for member in cls}
+            cls._LOOKUP = value_map
+        return value_map
@@ -0,0 +1,33 @@
+from typing import Any
+from bson import ObjectId
+from bson.errors import InvalidId
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+
+def validate_object_id(v: Any) -> ObjectId:
+    # Accept ObjectId instances as-is; parse strings in a single pass
+    # instead of is_valid() followed by a second construction
+    if isinstance(v, ObjectId):
+        return v
+    try:
+        return ObjectId(v)
+    except (InvalidId, TypeError):
+        raise ValueError("Invalid objectid")
+
+
+class PyObjectId(ObjectId):
+    """Shared ObjectId field type for Pydantic models"""
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler):
+        return core_schema.no_info_plain_validator_function(
+            validate_object_id,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                str, when_used="json"
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema, handler):
+        return {"type": "string"}
@@ -1,14 +1,15 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
-from enum import Enum
+from typing import Annotated, Optional, List
+from annotated_types import Len
+from ._enums import ValueLookupEnum
 from datetime import datetime, date
 
-class AircraftType(str, Enum):
+class AircraftType(ValueLookupEnum):
     HELICOPTER = "helicopter"
     FIXED_WING = "fixed_wing"
     JET = "jet"
 
-class AircraftStatus(str, Enum):
+class AircraftStatus(ValueLookupEnum):
     AVAILABLE = "available"
     IN_MAINTENANCE = "in_maintenance"
     IN_USE = "in_use"
@@ -28,7 +29,8 @@ class AircraftBase(BaseModel):
     max_payload_kg: int = Field(..., gt=0)
     cabin_configuration: str
     base_location: str
-    medical_equipment: List[MedicalEquipment]
+    # Length cap rejects oversized payloads before per-element validation
+    medical_equipment: Annotated[List[MedicalEquipment], Len(max_length=64)]
     status: AircraftStatus = AircraftStatus.AVAILABLE
     latitude: float = 0.0
     longitude: float = 0.0
@@ -46,7 +48,7 @@ class AircraftUpdate(BaseModel):
     cabin_configuration: Optional[str] = None
     base_location: Optional[str] = None
     status: Optional[AircraftStatus] = None
-    medical_equipment: Optional[List[MedicalEquipment]] = None
+    medical_equipment: Optional[Annotated[List[MedicalEquipment], Len(max_length=64)]] = None
 
 class MaintenanceRecord(BaseModel):
     id: str
@@ -1,28 +1,20 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Annotated, Optional, List
+from annotated_types import Len
+from time import monotonic
+from ._enums import ValueLookupEnum
 from datetime import datetime, date, time
 from .patient import Patient, AcuityLevel
 from .hospital import Hospital
 from .aircraft import Aircraft
 from bson import ObjectId
+from ._objectid import PyObjectId
+import logging
+import re
 
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
-
-    @classmethod
-    def validate(cls, v):
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid objectid")
-        return ObjectId(v)
-
-    @classmethod
-    def __modify_schema__(cls, field_schema):
-        field_schema.update(type="string")
+logger = logging.getLogger(__name__)
 
-class BookingStatus(str, Enum):
+class BookingStatus(ValueLookupEnum):
     PENDING = "pending"
     APPROVED = "approved"
     SCHEDULED = "scheduled"
@@ -30,7 +22,7 @@ class BookingStatus(str, Enum):
     COMPLETED = "completed"
     CANCELLED = "cancelled"
 
-class EquipmentType(str, Enum):
+class EquipmentType(ValueLookupEnum):
     VENTILATOR = "ventilator"
     ECG_MONITOR = "ecg_monitor"
     DEFIBRILLATOR = "defibrillator"
@@ -38,6 +30,54 @@ class EquipmentType(str, Enum):
     INFUSION_PUMP = "infusion_pump"
     PATIENT_MONITOR = "patient_monitor"
 
+# Lowercase + space->underscore in one table-driven pass
+_EQUIP_NORMALIZE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ ", "abcdefghijklmnopqrstuvwxyz_")
+
+# Fuzzy fallbacks for values the exact enum lookup misses, compiled
+# once at import; the monitor catch-all must stay ahead of the bare
+# "patient" match
+_EQUIP_ALIASES = (
+    (re.compile(r"ventilator"), EquipmentType.VENTILATOR),
+    (re.compile(r"ecg|monitor"), EquipmentType.ECG_MONITOR),
+    (re.compile(r"defib"), EquipmentType.DEFIBRILLATOR),
+    (re.compile(r"oxygen"), EquipmentType.OXYGEN_SUPPLY),
+    (re.compile(r"infusion"), EquipmentType.INFUSION_PUMP),
+    (re.compile(r"patient"), EquipmentType.PATIENT_MONITOR),
+)
+
+def normalize_equipment_data(equipment_list: List) -> List[EquipmentType]:
+    """Convert equipment data to proper enum values"""
+    normalized_equipment = []
+    for equipment in equipment_list:
+        if isinstance(equipment, EquipmentType):
+            normalized_equipment.append(equipment)
+        elif isinstance(equipment, str):
+            normalized = equipment.translate(_EQUIP_NORMALIZE)
+            member = EquipmentType.lookup(normalized)
+            if member is None:
+                for pattern, alias in _EQUIP_ALIASES:
+                    if pattern.search(normalized):
+                        member = alias
+                        break
+            if member is not None:
+                normalized_equipment.append(member)
+            else:
+                logger.warning(f"Unknown equipment type: {equipment}")
+        else:
+            logger.warning(f"Invalid equipment type: {equipment}")
+
+    return normalized_equipment
+
+_NOON = time(12, 0)
+_today_cache = [date.min, 0.0]
+
+def _cached_today() -> date:
+    now = monotonic()
+    if now - _today_cache[1] >= 1.0:
+        _today_cache[0] = date.today()
+        _today_cache[1] = now
+    return _today_cache[0]
+
 class BookingBase(BaseModel):
     booking_id: Optional[str] = None
     patient_id: str
@@ -46,7 +86,8 @@ class BookingBase(BaseModel):
     destination_hospital_id: str
     preferred_date: date  # Keep as date for API
     preferred_time: time  # Keep as time for API
-    required_equipment: List[EquipmentType]
+    # Length cap rejects oversized payloads before per-element validation
+    required_equipment: Annotated[List[EquipmentType], Len(max_length=16)]
     special_instructions: Optional[str] = None
 
 class BookingCreate(BookingBase):
@@ -56,14 +97,14 @@ class BookingUpdate(BaseModel):
     urgency: Optional[AcuityLevel] = None
     preferred_date: Optional[date] = None
     preferred_time: Optional[time] = None
-    required_equipment: Optional[List[EquipmentType]] = None
+    required_equipment: Optional[Annotated[List[EquipmentType], Len(max_length=16)]] = None
     special_instructions: Optional[str] = None
     patient_id: Optional[str] = None
     origin_hospital_id: Optional[str] = None
     destination_hospital_id: Optional[str] = None
     status: Optional[BookingStatus] = None
     assigned_aircraft_id: Optional[str] = None
-    assigned_crew_ids: Optional[List[str]] = None
+    assigned_crew_ids: Optional[Annotated[List[str], Len(max_length=16)]] = None
     estimated_cost: Optional[float] = None
     actual_cost: Optional[float] = None
     flight_duration: Optional[int] = None 
@@ -72,7 +113,7 @@ class Booking(BookingBase):
     id: str
     status: BookingStatus
     assigned_aircraft_id: Optional[str] = None
-    assigned_crew_ids: List[str] = []
+    assigned_crew_ids: Annotated[List[str], Len(max_length=16)] = []
     estimated_cost: Optional[float] = None
     actual_cost: Optional[float] = None
     flight_duration: Optional[int] = None
@@ -80,9 +121,44 @@ class Booking(BookingBase):
     updated_at: datetime
     created_by: str
 
-    class Config:
-        from_attributes = True
-        json_encoders = {ObjectId: str}
+    # json_encoders is Pydantic v2's slow legacy path; ObjectId ids are
+    # already stringified before they reach the model
+    model_config = ConfigDict(from_attributes=True)
+
+    # Stored documents predate today's schema: dates written as
+    # datetimes, times as "HH:MM[:SS]" strings (or missing), equipment
+    # as free-ish text. These before-validators absorb that here so the
+    # routes don't massage each row in Python first. They sit on Booking
+    # rather than BookingBase so request payloads (BookingCreate) keep
+    # strict validation.
+    @field_validator("preferred_date", mode="before")
+    @classmethod
+    def _coerce_preferred_date(cls, v):
+        if isinstance(v, datetime):
+            return v.date()
+        if v is None:
+            return _cached_today()
+        return v
+
+    @field_validator("preferred_time", mode="before")
+    @classmethod
+    def _coerce_preferred_time(cls, v):
+        if isinstance(v, str):
+            try:
+                parts = v.split(":")
+                return time(int(parts[0]), int(parts[1]), int(parts[2]) if len(parts) > 2 else 0)
+            except (IndexError, ValueError):
+                return _NOON
+        if v is None:
+            return _NOON
+        return v
+
+    @field_validator("required_equipment", mode="before")
+    @classmethod
+    def _coerce_equipment(cls, v):
+        if isinstance(v, list):
+            return normalize_equipment_data(v)
+        return v
 
 class BookingWithDetails(Booking):
     patient: Optional[Patient] = None
@@ -93,9 +169,9 @@ class BookingWithDetails(Booking):
 class FlightSchedule(BaseModel):
     booking_id: str
     aircraft_id: str
-    crew_ids: List[str]
+    crew_ids: Annotated[List[str], Len(max_length=16)]
     scheduled_departure: datetime
     scheduled_arrival: datetime
     actual_departure: Optional[datetime] = None
     actual_arrival: Optional[datetime] = None
-    route_coordinates: List[List[float]] = []
\ No newline at end of file
+    route_coordinates: Annotated[List[List[float]], Len(max_length=1024)] = []
\ No newline at end of file
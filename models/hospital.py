@@ -1,17 +1,17 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional, List
-from enum import Enum
+from ._enums import ValueLookupEnum
 from datetime import datetime
 
 
-class LevelOfCare(str, Enum):
+class LevelOfCare(ValueLookupEnum):
     BASIC = "basic"
     ADVANCED = "advanced"
     TERTIARY = "tertiary"
     TRAUMA_CENTER = "trauma_center"
 
 
-class StaffRole(str, Enum):
+class StaffRole(ValueLookupEnum):
     DOCTOR = "doctor"
     NURSE = "nurse"
     RECEPTION = "reception"
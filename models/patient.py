@@ -1,39 +1,26 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Optional, List
+from annotated_types import Len
+from ._enums import ValueLookupEnum
 from datetime import datetime, date
 from bson import ObjectId
+from ._objectid import PyObjectId
 
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
 
-    @classmethod
-    def validate(cls, v):
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid objectid")
-        return ObjectId(v)
-
-    @classmethod
-    def __modify_schema__(cls, field_schema):
-        field_schema.update(type="string")
-
-
-class AcuityLevel(str, Enum):
+class AcuityLevel(ValueLookupEnum):
     CRITICAL = "critical"
     URGENT = "urgent"
     STABLE = "stable"
 
 
-class Gender(str, Enum):
+class Gender(ValueLookupEnum):
     MALE = "male"
     FEMALE = "female"
     OTHER = "other"
 
 
 # ✅ New Blood Group Enum
-class BloodGroup(str, Enum):
+class BloodGroup(ValueLookupEnum):
     A_POS = "A+"
     A_NEG = "A-"
     B_POS = "B+"
@@ -81,9 +68,10 @@ class PatientBase(BaseModel):
     # ✅ Added assigned hospital
     assigned_hospital_id: Optional[str] = None
 
-    allergies: List[str] = []
+    # Length caps reject oversized payloads before per-element validation
+    allergies: Annotated[List[str], Len(max_length=64)] = []
     current_vitals: Optional[CurrentVitals] = None
-    special_equipment_needed: List[str] = []
+    special_equipment_needed: Annotated[List[str], Len(max_length=32)] = []
     insurance_details: InsuranceDetails
     next_of_kin: NextOfKin
 
@@ -100,9 +88,9 @@ class PatientUpdate(BaseModel):
     acuity_level: Optional[AcuityLevel] = None
     blood_group: Optional[BloodGroup] = None   # ✅ Added here
     assigned_hospital_id: Optional[str] = None # ✅ Added here
-    allergies: Optional[List[str]] = None
+    allergies: Optional[Annotated[List[str], Len(max_length=64)]] = None
     current_vitals: Optional[CurrentVitals] = None
-    special_equipment_needed: Optional[List[str]] = None
+    special_equipment_needed: Optional[Annotated[List[str], Len(max_length=32)]] = None
 
 
 class Patient(PatientBase):
@@ -111,6 +99,4 @@ class Patient(PatientBase):
     updated_at: datetime
     created_by: str
 
-    class Config:
-        from_attributes = True
-        json_encoders = {ObjectId: str}
+    model_config = ConfigDict(from_attributes=True)
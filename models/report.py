@@ -1,9 +1,9 @@
 from pydantic import BaseModel
 from typing import Optional, List, Dict
 from datetime import datetime, date
-from enum import Enum
+from ._enums import ValueLookupEnum
 
-class ReportType(str, Enum):
+class ReportType(ValueLookupEnum):
     BOOKING = "booking"
     AIRCRAFT_UTILIZATION = "aircraft_utilization"
     BILLING = "billing"
@@ -1,26 +1,51 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from typing import Optional, Dict, Any
 from datetime import datetime
-from enum import Enum
+from models._enums import ValueLookupEnum
 from bson import ObjectId
 from models.user import User
 
-class NotificationType(str, Enum):
+# Notification booleans packed into one int for storage: bit i of `flags`
+# is FLAG_FIELDS[i]. Mongo stores a single int instead of nine BSON bools,
+# and partial updates become one masked OR instead of nine $set fields.
+FLAG_FIELDS = (
+    "notifications_enabled",
+    "email_notifications",
+    "sms_notifications",
+    "push_notifications",
+    "browser_notifications",
+    "notify_booking_updates",
+    "notify_emergency_alerts",
+    "notify_system_maintenance",
+    "notify_promotions",
+)
+
+ALL_FLAGS = (1 << len(FLAG_FIELDS)) - 1
+
+def pack_flags(values: Dict[str, Any]) -> int:
+    """Pack the notification booleans of a settings dict into a bitmask"""
+    return sum(1 << i for i, name in enumerate(FLAG_FIELDS) if values.get(name))
+
+def unpack_flags(flags: int) -> Dict[str, bool]:
+    """Expand a bitmask back into the per-field notification booleans"""
+    return {name: bool(flags >> i & 1) for i, name in enumerate(FLAG_FIELDS)}
+
+class NotificationType(ValueLookupEnum):
     EMAIL = "email"
     SMS = "sms"
     PUSH = "push"
     BROWSER = "browser"
 
-class TimeFormat(str, Enum):
+class TimeFormat(ValueLookupEnum):
     H12 = "12h"
     H24 = "24h"
 
-class DateFormat(str, Enum):
+class DateFormat(ValueLookupEnum):
     MM_DD_YYYY = "MM/DD/YYYY"
     DD_MM_YYYY = "DD/MM/YYYY"
     YYYY_MM_DD = "YYYY-MM-DD"
 
-class Theme(str, Enum):
+class Theme(ValueLookupEnum):
     LIGHT = "light"
     DARK = "dark"
     AUTO = "auto"
@@ -49,10 +74,26 @@ class UserSettings(BaseModel):
     
     # Email frequency
     email_digest_frequency: str = "daily"  # daily, weekly, never
-    
+
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    @computed_field
+    @property
+    def flags(self) -> int:
+        """Bitmask view of the notification booleans (what Mongo stores)"""
+        return sum(1 << i for i, name in enumerate(FLAG_FIELDS) if getattr(self, name))
+
+    @classmethod
+    def from_flags(cls, flags: int, **rest) -> "UserSettings":
+        """Build a settings model from a stored bitmask plus the scalar fields"""
+        return cls(**unpack_flags(flags), **rest)
+
+# Default bitmask for new users, derived from the field defaults above
+DEFAULT_FLAGS = pack_flags(
+    {name: UserSettings.model_fields[name].default for name in FLAG_FIELDS}
+)
+
 class UserSettingsCreate(BaseModel):
     theme: Optional[Theme] = Theme.LIGHT
     time_format: Optional[TimeFormat] = TimeFormat.H12
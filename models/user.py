@@ -1,14 +1,14 @@
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List
-from enum import Enum
+from ._enums import ValueLookupEnum
 from datetime import datetime
 
-class Gender(str, Enum):
+class Gender(ValueLookupEnum):
     MALE = "male"
     FEMALE = "female"
     OTHER = "other"
 
-class UserRole(str, Enum):
+class UserRole(ValueLookupEnum):
     SUPERADMIN = "superadmin"
     DISPATCHER = "dispatcher"
     HOSPITAL_STAFF = "hospital_staff"
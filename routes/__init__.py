@@ -10,6 +10,7 @@ from .reports import router as reports_router
 from .dashboard import router as dashboard_router
 from .settings import router as settings_router
 from .notifications import router as notifications_router
+from .batch import router as batch_router
 
 __all__ = [
     "auth_router",
@@ -21,5 +22,6 @@ __all__ = [
     "reports_router",
     "dashboard_router",
     "settings_router",
-    "notifications_router"
+    "notifications_router",
+    "batch_router"
 ]
\ No newline at end of file
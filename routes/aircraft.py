@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
-from database.connection import get_collection
+from database.connection import get_async_collection
 from models.aircraft import Aircraft, AircraftCreate, AircraftUpdate, AircraftStatus
 from models.user import User, UserRole
 from routes.auth import get_current_active_user
 from bson import ObjectId
+from bson.errors import InvalidId
+from cachetools import TTLCache
+from pymongo import ReturnDocument
 from typing import Annotated
 from datetime import datetime
 import logging
@@ -12,6 +16,10 @@ import logging
 router = APIRouter(prefix="/api/aircraft", tags=["aircraft"])
 logger = logging.getLogger(__name__)
 
+# Bound once at import — lifespan connects Mongo before routers load
+aircraft_collection = get_async_collection("aircraft")
+users_collection = get_async_collection("users")
+
 # Import NotificationService with fallback
 try:
     from utils.notification import NotificationService
@@ -26,31 +34,57 @@ except ImportError:
         async def send_maintenance_reminder(aircraft_id, message):
             print(f"🔧 MOCK MAINTENANCE: {message}")
 
+from utils.notification_queue import enqueue
+
+# The staff recipient list changes rarely; a short TTL keeps a burst of
+# aircraft mutations from re-querying the same three roles every time
+_staff_cache = TTLCache(maxsize=8, ttl=30)
+
+# Notifications only ever read id/email/full_name/role off these users
+_STAFF_PROJECTION = {"email": 1, "full_name": 1, "role": 1, "is_active": 1}
+
+_STAFF_ROLES = (UserRole.AIRLINE_COORDINATOR, UserRole.SUPERADMIN, UserRole.DISPATCHER)
+
+# Roles allowed to create/update/delete aircraft — one frozenset shared
+# by every handler instead of a list literal per request
+_MUTATE_ROLES = frozenset({UserRole.SUPERADMIN, UserRole.DISPATCHER, UserRole.AIRLINE_COORDINATOR})
+
+def _parse_aircraft_id(aircraft_id: str) -> ObjectId:
+    # One constructor call parses and validates; is_valid + ObjectId(...)
+    # walked the hex string twice
+    try:
+        return ObjectId(aircraft_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid aircraft ID format")
+
+async def _get_staff_recipients() -> List[User]:
+    staff = _staff_cache.get("staff")
+    if staff is None:
+        cursor = users_collection.find(
+            {"role": {"$in": list(_STAFF_ROLES)}, "is_active": True},
+            _STAFF_PROJECTION
+        )
+        # model_construct skips validation — these docs came straight
+        # from our own users collection
+        staff = [
+            User.model_construct(id=str(user.pop("_id")), **user)
+            async for user in cursor
+        ]
+        _staff_cache["staff"] = staff
+    return staff
+
 async def get_aircraft_notification_recipients(current_user: User, action: str, aircraft_data: dict = None) -> List[User]:
-    users_collection = get_collection("users")
-    recipients = []
-    
     try:
-        recipients.append(current_user)
-        
+        recipients = [current_user]
+
         if action in ["created", "updated", "maintenance"]:
-            relevant_staff = users_collection.find({
-                "role": {"$in": [UserRole.AIRLINE_COORDINATOR, UserRole.SUPERADMIN, UserRole.DISPATCHER]},
-                "is_active": True
-            })
-            recipients.extend([User(**user) for user in relevant_staff])
-        
-        unique_recipients = []
-        seen_ids = set()
-        for recipient in recipients:
-            if str(recipient.id) not in seen_ids:
-                unique_recipients.append(recipient)
-                seen_ids.add(str(recipient.id))
-        
-        return unique_recipients
-        
+            recipients.extend(await _get_staff_recipients())
+
+        # Dedup by id, keeping first occurrence (the acting user)
+        return list({str(recipient.id): recipient for recipient in recipients}.values())
+
     except Exception as e:
-        logger.error(f"Error getting aircraft notification recipients: {e}")
+        logger.error("Error getting aircraft notification recipients: %s", e)
         return [current_user]
 
 @router.post("", response_model=Aircraft)
@@ -58,14 +92,13 @@ async def create_aircraft(
     aircraft_data: AircraftCreate,
     current_user: Annotated[User, Depends(get_current_active_user)]
 ):
-    if current_user.role not in [UserRole.SUPERADMIN, UserRole.DISPATCHER, UserRole.AIRLINE_COORDINATOR]:
+    if current_user.role not in _MUTATE_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
     
     try:
-        aircraft_collection = get_collection("aircraft")
         aircraft_dict = aircraft_data.dict()
         aircraft_dict["created_at"] = aircraft_dict["updated_at"] = datetime.utcnow()
         aircraft_dict["maintenance_records"] = []
@@ -73,85 +106,151 @@ async def create_aircraft(
         if "status" not in aircraft_dict or not aircraft_dict["status"]:
             aircraft_dict["status"] = AircraftStatus.AVAILABLE
         
-        result = aircraft_collection.insert_one(aircraft_dict)
+        # AircraftCreate already validated the payload — skip the
+        # server-side schema pass
+        result = await aircraft_collection.insert_one(aircraft_dict, bypass_document_validation=True)
         aircraft_id = str(result.inserted_id)
         aircraft_dict["id"] = aircraft_id
         
         recipients = await get_aircraft_notification_recipients(current_user, "created", aircraft_dict)
         notification_message = f"New aircraft registered: {aircraft_dict['registration']} ({aircraft_dict['aircraft_type']}). Base: {aircraft_dict.get('base_location', 'Unknown')}. Status: {aircraft_dict['status']}"
         
-        await NotificationService.send_system_notification(
+        # Delivery happens on the background queue, not request latency
+        enqueue(
             users=recipients,
             title="New Aircraft Registered",
             message=notification_message,
             notification_type="info"
         )
         
-        logger.info(f"✅ Aircraft created: {aircraft_dict['registration']} by user {current_user.email}")
-        return Aircraft(**aircraft_dict)
+        logger.info("✅ Aircraft created: %s by user %s", aircraft_dict["registration"], current_user.email)
+        # Already validated as AircraftCreate on the way in
+        return Aircraft.model_construct(**aircraft_dict)
     
     except Exception as e:
-        logger.error(f"❌ Error creating aircraft: {e}")
+        logger.error("❌ Error creating aircraft: %s", e)
         raise HTTPException(status_code=500, detail="Error creating aircraft")
 
-@router.get("", response_model=List[Aircraft])
+@router.post("/bulk", response_class=ORJSONResponse)
+async def create_aircraft_bulk(
+    aircraft_batch: List[AircraftCreate],
+    current_user: Annotated[User, Depends(get_current_active_user)]
+):
+    if current_user.role not in _MUTATE_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    if not aircraft_batch:
+        raise HTTPException(status_code=400, detail="No aircraft provided")
+
+    try:
+        now = datetime.utcnow()
+        docs = []
+        for aircraft_data in aircraft_batch:
+            aircraft_dict = aircraft_data.dict()
+            aircraft_dict["created_at"] = aircraft_dict["updated_at"] = now
+            aircraft_dict["maintenance_records"] = []
+            if not aircraft_dict.get("status"):
+                aircraft_dict["status"] = AircraftStatus.AVAILABLE
+            docs.append(aircraft_dict)
+
+        # One round trip for the whole batch
+        result = await aircraft_collection.insert_many(
+            docs, ordered=False, bypass_document_validation=True
+        )
+
+        recipients = await get_aircraft_notification_recipients(current_user, "created")
+        registrations = ", ".join(doc["registration"] for doc in docs)
+        # One summary notification for the batch, not one per aircraft
+        enqueue(
+            users=recipients,
+            title="Aircraft Batch Registered",
+            message=f"{len(docs)} aircraft registered: {registrations}",
+            notification_type="info"
+        )
+
+        logger.info("✅ %d aircraft created in bulk by user %s", len(docs), current_user.email)
+        return ORJSONResponse({
+            "created": len(result.inserted_ids),
+            "ids": [str(inserted_id) for inserted_id in result.inserted_ids],
+        })
+
+    except Exception as e:
+        logger.error("❌ Error creating aircraft in bulk: %s", e)
+        raise HTTPException(status_code=500, detail="Error creating aircraft in bulk")
+
+@router.get("", response_class=ORJSONResponse)
 async def get_aircrafts(
     current_user: Annotated[User, Depends(get_current_active_user)],
     status: Optional[AircraftStatus] = None,
-    skip: int = 0,
-    limit: int = 100
+    after_id: Optional[str] = Query(None, description="Return aircraft after this id (keyset cursor)"),
+    limit: int = 100,
+    skip: int = Query(0, deprecated=True, description="Deprecated — paginate with after_id instead"),
 ):
     try:
-        aircraft_collection = get_collection("aircraft")
         query = {}
         if status:
             query["status"] = status
-        
-        cursor = aircraft_collection.find(query).skip(skip).limit(limit)
-        aircraft_list = []
-        for aircraft in cursor:
-            aircraft["id"] = str(aircraft["_id"])
-            aircraft_list.append(Aircraft(**aircraft))
-        
-        logger.info(f"📋 Retrieved {len(aircraft_list)} aircraft for user {current_user.email}")
-        return aircraft_list
+        # Keyset pagination seeks the _id index directly; skip(n) walks
+        # and discards n documents server-side first
+        if after_id:
+            query["_id"] = {"$gt": _parse_aircraft_id(after_id)}
+
+        cursor = aircraft_collection.find(query).sort("_id", 1)
+        if skip:
+            cursor = cursor.skip(skip)
+
+        # These docs were validated on write — serialize them straight to
+        # orjson instead of round-tripping each through the Aircraft model
+        aircraft_list = await cursor.limit(limit).to_list(length=limit)
+        for aircraft in aircraft_list:
+            aircraft["id"] = str(aircraft.pop("_id"))
+
+        logger.info("📋 Retrieved %d aircraft for user %s", len(aircraft_list), current_user.email)
+        return ORJSONResponse({
+            "items": aircraft_list,
+            "next_cursor": (
+                aircraft_list[-1]["id"]
+                if aircraft_list and len(aircraft_list) == limit
+                else None
+            ),
+        })
     
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"❌ Error retrieving aircraft: {e}")
+        logger.error("❌ Error retrieving aircraft: %s", e)
         raise HTTPException(status_code=500, detail="Error retrieving aircraft")
 
 @router.get("/available/count")
 async def get_available_aircraft_count(current_user: Annotated[User, Depends(get_current_active_user)]):
     try:
-        aircraft_collection = get_collection("aircraft")
-        count = aircraft_collection.count_documents({"status": "available"})
-        logger.info(f"📊 Available aircraft count: {count}")
+        count = await aircraft_collection.count_documents({"status": "available"})
+        logger.info("📊 Available aircraft count: %d", count)
         return {"available_aircraft_count": count}
     
     except Exception as e:
-        logger.error(f"❌ Error getting available aircraft count: {e}")
+        logger.error("❌ Error getting available aircraft count: %s", e)
         raise HTTPException(status_code=500, detail="Error getting available aircraft count")
 
-@router.get("/{aircraft_id}", response_model=Aircraft)
+@router.get("/{aircraft_id}", response_class=ORJSONResponse)
 async def get_aircraft(aircraft_id: str, current_user: Annotated[User, Depends(get_current_active_user)]):
     try:
-        aircraft_collection = get_collection("aircraft")
-        
-        if not ObjectId.is_valid(aircraft_id):
-            raise HTTPException(status_code=400, detail="Invalid aircraft ID format")
-        
-        aircraft_data = aircraft_collection.find_one({"_id": ObjectId(aircraft_id)})
-        
+
+        aircraft_data = await aircraft_collection.find_one({"_id": _parse_aircraft_id(aircraft_id)})
+
         if not aircraft_data:
             raise HTTPException(status_code=404, detail="Aircraft not found")
-        
-        aircraft_data["id"] = str(aircraft_data["_id"])
-        return Aircraft(**aircraft_data)
+
+        aircraft_data["id"] = str(aircraft_data.pop("_id"))
+        return ORJSONResponse(aircraft_data)
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error retrieving aircraft {aircraft_id}: {e}")
+        logger.error("❌ Error retrieving aircraft %s: %s", aircraft_id, e)
         raise HTTPException(status_code=500, detail="Error retrieving aircraft")
 
 @router.put("/{aircraft_id}", response_model=Aircraft)
@@ -160,45 +259,41 @@ async def update_aircraft(
     aircraft_update: AircraftUpdate,
     current_user: Annotated[User, Depends(get_current_active_user)]
 ):
-    if current_user.role not in [UserRole.SUPERADMIN, UserRole.DISPATCHER, UserRole.AIRLINE_COORDINATOR]:
+    if current_user.role not in _MUTATE_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
     
     try:
-        aircraft_collection = get_collection("aircraft")
-        
-        if not ObjectId.is_valid(aircraft_id):
-            raise HTTPException(status_code=400, detail="Invalid aircraft ID format")
-        
-        current_aircraft = aircraft_collection.find_one({"_id": ObjectId(aircraft_id)})
-        if not current_aircraft:
-            raise HTTPException(status_code=404, detail="Aircraft not found")
-        
-        update_data = {k: v for k, v in aircraft_update.dict().items() if v is not None}
+        oid = _parse_aircraft_id(aircraft_id)
+
+        # Only materialize fields the client actually sent
+        update_data = aircraft_update.model_dump(exclude_unset=True, exclude_none=True)
         update_data["updated_at"] = datetime.utcnow()
-        
-        old_status = current_aircraft.get("status")
+
+        # One round trip instead of find_one + update_one + find_one: ask
+        # for the pre-image and overlay update_data to get the post-image
+        previous = await aircraft_collection.find_one_and_update(
+            {"_id": oid},
+            {"$set": update_data},
+            return_document=ReturnDocument.BEFORE
+        )
+        if not previous:
+            raise HTTPException(status_code=404, detail="Aircraft not found")
+
+        old_status = previous.get("status")
         new_status = update_data.get('status')
         status_changed = new_status and new_status != old_status
-        
-        result = aircraft_collection.update_one(
-            {"_id": ObjectId(aircraft_id)},
-            {"$set": update_data}
-        )
-        
-        if result.modified_count == 0:
-            raise HTTPException(status_code=404, detail="Aircraft not found or no changes made")
-        
-        aircraft_data = aircraft_collection.find_one({"_id": ObjectId(aircraft_id)})
+
+        aircraft_data = {**previous, **update_data}
         aircraft_data["id"] = str(aircraft_data["_id"])
-        
+
         if status_changed:
             recipients = await get_aircraft_notification_recipients(current_user, "status_change", aircraft_data)
             status_message = f"Aircraft {aircraft_data['registration']} status changed: {old_status} → {new_status}"
             
-            await NotificationService.send_system_notification(
+            enqueue(
                 users=recipients,
                 title="Aircraft Status Updated",
                 message=status_message,
@@ -212,13 +307,13 @@ async def update_aircraft(
                     message=maintenance_message
                 )
         
-        logger.info(f"✅ Aircraft updated: {aircraft_data['registration']} by user {current_user.email}")
-        return Aircraft(**aircraft_data)
+        logger.info("✅ Aircraft updated: %s by user %s", aircraft_data["registration"], current_user.email)
+        return Aircraft.model_construct(**aircraft_data)
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error updating aircraft {aircraft_id}: {e}")
+        logger.error("❌ Error updating aircraft %s: %s", aircraft_id, e)
         raise HTTPException(status_code=500, detail="Error updating aircraft")
     
     
@@ -227,29 +322,22 @@ async def delete_aircraft(
     aircraft_id: str,
     current_user: Annotated[User, Depends(get_current_active_user)]
 ):
-    if current_user.role not in [
-        UserRole.SUPERADMIN,
-        UserRole.DISPATCHER,
-        UserRole.AIRLINE_COORDINATOR
-    ]:
+    if current_user.role not in _MUTATE_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions to delete aircraft"
         )
 
     try:
-        aircraft_collection = get_collection("aircraft")
-
-        if not ObjectId.is_valid(aircraft_id):
-            raise HTTPException(status_code=400, detail="Invalid aircraft ID format")
+        oid = _parse_aircraft_id(aircraft_id)
 
-        aircraft_data = aircraft_collection.find_one({"_id": ObjectId(aircraft_id)})
+        aircraft_data = await aircraft_collection.find_one({"_id": oid})
 
         if not aircraft_data:
             raise HTTPException(status_code=404, detail="Aircraft not found")
 
         # Delete aircraft
-        aircraft_collection.delete_one({"_id": ObjectId(aircraft_id)})
+        await aircraft_collection.delete_one({"_id": oid})
 
         # Prepare notification
         aircraft_data["id"] = str(aircraft_data["_id"])
@@ -258,18 +346,18 @@ async def delete_aircraft(
         recipients = await get_aircraft_notification_recipients(current_user, "deleted", aircraft_data)
         message = f"Aircraft {registration} has been permanently deleted from the system."
 
-        await NotificationService.send_system_notification(
+        enqueue(
             users=recipients,
             title="Aircraft Deleted",
             message=message,
             notification_type="danger"
         )
 
-        logger.info(f"🗑️ Aircraft deleted: {registration} by user {current_user.email}")
+        logger.info("🗑️ Aircraft deleted: %s by user %s", registration, current_user.email)
         return {"message": f"Aircraft {registration} deleted successfully"}
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error deleting aircraft {aircraft_id}: {e}")
+        logger.error("❌ Error deleting aircraft %s: %s", aircraft_id, e)
         raise HTTPException(status_code=500, detail="Error deleting aircraft")
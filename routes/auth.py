@@ -1,14 +1,17 @@
 # routes/auth.py
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
+import asyncio
+import os
 
-from database.connection import get_collection
+from database.connection import get_async_collection
 from models.user import (
     User, UserCreate, LoginRequest, Token,
-    ForgotPasswordRequest, ResetPasswordRequest
+    ForgotPasswordRequest, ResetPasswordRequest, UserRole
 )
 from utils.auth import (
     verify_password, get_password_hash,
@@ -16,6 +19,8 @@ from utils.auth import (
     generate_otp, send_email_otp
 )
 
+from cachetools import TTLCache
+
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
 oauth2_scheme = OAuth2PasswordBearer(
@@ -23,22 +28,49 @@ oauth2_scheme = OAuth2PasswordBearer(
     auto_error=False
 )
 
+# get_current_user runs on every authenticated endpoint; cache the
+# token -> User resolution briefly so a burst of requests from one
+# client doesn't repeat the JWT verify + Mongo lookup each time
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# bcrypt is ~100 ms of pure CPU per call; hash and verify in worker
+# processes so the event loop keeps serving other requests meanwhile
+_hash_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+async def _run_hashing(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool, func, *args)
+
+# Bound once at import — lifespan connects Mongo before routers load
+users_collection = get_async_collection("users")
+
+# Fetch only what the User response and token payload need — user docs
+# can carry heavyweight extras like profile_picture history
+_USER_PROJECTION = {
+    "email": 1, "full_name": 1, "phone": 1, "role": 1, "is_active": 1,
+    "profile_picture": 1, "created_at": 1, "updated_at": 1,
+}
+
+_LOGIN_PROJECTION = {
+    **_USER_PROJECTION,
+    "hashed_password": 1, "hospital_id": 1, "hospital_name": 1,
+}
+
 # ==================================================
 # GET CURRENT USER
 # ==================================================
 async def get_current_user(
-    request: Request,
     token: Optional[str] = Depends(oauth2_scheme)
 ):
-    if request.method == "OPTIONS":
-        return None
-
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing authentication token"
         )
 
+    cached_user = _user_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+
     token_data = decode_access_token(token)
 
     if not token_data or "sub" not in token_data:
@@ -47,8 +79,7 @@ async def get_current_user(
             detail="Invalid or expired token"
         )
 
-    users_collection = get_collection("users")
-    user_data = users_collection.find_one({"email": token_data["sub"]})
+    user_data = await users_collection.find_one({"email": token_data["sub"]}, _USER_PROJECTION)
 
     if not user_data:
         raise HTTPException(
@@ -56,17 +87,22 @@ async def get_current_user(
             detail="User not found"
         )
 
-    return User(
+    # Trusted read from our own users collection — skip revalidation.
+    # role still needs the enum coercion model_construct skips: handlers
+    # compare it against UserRole members and call .role.value
+    user = User.model_construct(
         id=str(user_data["_id"]),
         email=user_data["email"],
         full_name=user_data["full_name"],
         phone=user_data.get("phone", ""),
-        role=user_data["role"],
+        role=UserRole(user_data["role"]),
         is_active=user_data.get("is_active", True),
         profile_picture=user_data.get("profile_picture"),
         created_at=user_data.get("created_at", datetime.utcnow()),
         updated_at=user_data.get("updated_at", datetime.utcnow()),
     )
+    _user_cache[token] = user
+    return user
 
 
 async def get_current_active_user(
@@ -77,26 +113,44 @@ async def get_current_active_user(
     return current_user
 
 
+def require_roles(*roles: UserRole):
+    """Dependency factory gating a route to the given roles.
+
+    The allowed set is frozen once when the router module loads, so each
+    request pays one hash lookup instead of rebuilding a list and
+    scanning it. Role strings straight from Mongo hash like the enum
+    members, so no coercion is needed."""
+    allowed = frozenset(roles)
+
+    async def dependency(current_user: User = Depends(get_current_active_user)) -> User:
+        if current_user.role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enough permissions"
+            )
+        return current_user
+
+    return dependency
+
+
 # ==================================================
 # REGISTER
 # ==================================================
 @router.post("/register", response_model=User)
 async def register(user_data: UserCreate):
-    users_collection = get_collection("users")
-
-    if users_collection.find_one({"email": user_data.email}):
+    if await users_collection.find_one({"email": user_data.email}):
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await _run_hashing(get_password_hash, user_data.password)
 
     user_dict = user_data.dict()
     user_dict["hashed_password"] = hashed_password
     user_dict.pop("password")
     user_dict["created_at"] = user_dict["updated_at"] = datetime.utcnow()
 
-    result = users_collection.insert_one(user_dict)
+    result = await users_collection.insert_one(user_dict)
 
-    return User(
+    return User.model_construct(
         id=str(result.inserted_id),
         email=user_dict["email"],
         full_name=user_dict["full_name"],
@@ -114,20 +168,15 @@ async def register(user_data: UserCreate):
 # ==================================================
 @router.post("/login", response_model=Token)
 async def login(login_data: LoginRequest):
-    users_collection = get_collection("users")
-    user = users_collection.find_one({"email": login_data.email})
-
-    print(f"DEBUG LOGIN: Email={login_data.email}, UserFound={bool(user)}")
+    user = await users_collection.find_one({"email": login_data.email}, _LOGIN_PROJECTION)
 
     if not user:
-        print("DEBUG LOGIN: User not found")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
-    
-    password_valid = verify_password(login_data.password, user.get("hashed_password", ""))
-    print(f"DEBUG LOGIN: PasswordValid={password_valid}")
+
+    password_valid = await _run_hashing(verify_password, login_data.password, user.get("hashed_password", ""))
 
     if not password_valid:
         raise HTTPException(
@@ -151,7 +200,7 @@ async def login(login_data: LoginRequest):
     return Token(
         access_token=access_token,
         token_type="bearer",
-        user=User(
+        user=User.model_construct(
             id=str(user["_id"]),
             email=user["email"],
             full_name=user["full_name"],
@@ -170,8 +219,7 @@ async def login(login_data: LoginRequest):
 # ==================================================
 @router.post("/forgot-password")
 async def forgot_password(request: ForgotPasswordRequest):
-    users_collection = get_collection("users")
-    user = users_collection.find_one({"email": request.email})
+    user = await users_collection.find_one({"email": request.email})
 
     if not user:
         raise HTTPException(status_code=404, detail="Email not found")
@@ -179,7 +227,7 @@ async def forgot_password(request: ForgotPasswordRequest):
     otp = generate_otp()
     expiry = datetime.utcnow() + timedelta(minutes=5)
 
-    users_collection.update_one(
+    await users_collection.update_one(
         {"email": request.email},
         {"$set": {"reset_otp": otp, "otp_expiry": expiry}}
     )
@@ -195,22 +243,17 @@ async def forgot_password(request: ForgotPasswordRequest):
 # ==================================================
 @router.post("/reset-password")
 async def reset_password(data: ResetPasswordRequest):
-    users_collection = get_collection("users")
-    user = users_collection.find_one({"email": data.email})
-
-    if not user:
-        raise HTTPException(status_code=404, detail="Invalid email")
-
-    if user.get("reset_otp") != data.otp:
-        raise HTTPException(status_code=400, detail="Invalid OTP")
-
-    if user.get("otp_expiry") < datetime.utcnow():
-        raise HTTPException(status_code=400, detail="OTP expired")
+    hashed_password = await _run_hashing(get_password_hash, data.new_password)
 
-    hashed_password = get_password_hash(data.new_password)
-
-    users_collection.update_one(
-        {"_id": user["_id"]},
+    # Match email + OTP + unexpired expiry and apply the reset in one
+    # atomic call — one round trip, and no window for a concurrent
+    # request to race between the check and the write
+    user = await users_collection.find_one_and_update(
+        {
+            "email": data.email,
+            "reset_otp": data.otp,
+            "otp_expiry": {"$gt": datetime.utcnow()},
+        },
         {
             "$set": {
                 "hashed_password": hashed_password,
@@ -220,12 +263,12 @@ async def reset_password(data: ResetPasswordRequest):
         }
     )
 
-    return {"message": "Password reset successful"}
+    if user is None:
+        # Deliberately vague — don't reveal which of the checks failed
+        raise HTTPException(status_code=400, detail="Invalid or expired OTP")
 
+    # Password resets are rare; dropping the whole cache is cheaper than
+    # tracking a token -> email reverse map just for this
+    _user_cache.clear()
 
-# ==================================================
-# 🔥 OPTIONS HANDLER (THIS FIXES 400)
-# ==================================================
-@router.options("/{path:path}")
-async def auth_options_handler(path: str):
-    return Response(status_code=200)
+    return {"message": "Password reset successful"}
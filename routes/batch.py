@@ -0,0 +1,92 @@
+from fastapi import APIRouter, HTTPException, Request, status
+from pydantic import BaseModel, Field
+from typing import Any, List, Optional
+import asyncio
+import json
+
+router = APIRouter(prefix="/api/batch", tags=["batch"])
+
+# Cap fan-out so one request can't amplify into unbounded server work
+MAX_BATCH_SIZE = 50
+
+# Only these inbound headers are forwarded to sub-requests
+FORWARDED_HEADERS = ("authorization", "accept-language", "x-request-id")
+
+class SubRequest(BaseModel):
+    id: str
+    method: str = "GET"
+    url: str
+    body: Optional[Any] = None
+
+class BatchRequest(BaseModel):
+    requests: List[SubRequest] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+async def _invoke(app, sub: SubRequest, headers: list):
+    """Dispatch one sub-request through the ASGI app in-process"""
+    body = b"" if sub.body is None else json.dumps(sub.body).encode()
+    path, _, query = sub.url.partition("?")
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": sub.method.upper(),
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": headers + [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 0),
+        "server": ("batch", 0),
+    }
+
+    response = {"status": 500, "body": b""}
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    try:
+        await app(scope, receive, send)
+    except Exception as e:
+        return {"id": sub.id, "status": 500, "body": {"detail": str(e)}}
+
+    try:
+        parsed = json.loads(response["body"]) if response["body"] else None
+    except ValueError:
+        parsed = response["body"].decode("utf-8", errors="replace")
+
+    return {"id": sub.id, "status": response["status"], "body": parsed}
+
+@router.post("")
+async def batch(batch_request: BatchRequest, request: Request):
+    """Execute several API calls in one round trip
+
+    Sub-requests run concurrently through the app itself, so a dashboard
+    page pays one TCP+TLS+auth handshake instead of one per endpoint.
+    """
+    for sub in batch_request.requests:
+        if sub.url.startswith("/api/batch"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Nested batch requests are not allowed"
+            )
+
+    # Forward auth so each sub-request is authorized individually
+    headers = [
+        (key.encode(), value.encode())
+        for key, value in request.headers.items()
+        if key.lower() in FORWARDED_HEADERS
+    ]
+
+    results = await asyncio.gather(*(
+        _invoke(request.app, sub, headers) for sub in batch_request.requests
+    ))
+
+    return {"responses": results}
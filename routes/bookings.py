@@ -1,19 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
-from typing import List, Optional
-from database.connection import get_collection
-from models.booking import Booking, BookingCreate, BookingUpdate, BookingStatus, BookingWithDetails, EquipmentType
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from typing import Dict, List, Optional
+from database.connection import get_async_collection
+from models.booking import (
+    Booking, BookingCreate, BookingUpdate, BookingStatus, BookingWithDetails,
+    EquipmentType, normalize_equipment_data
+)
 from models.user import User, UserRole
-from routes.auth import get_current_active_user
+from routes.auth import get_current_active_user, require_roles
 from bson import ObjectId
+from bson.errors import InvalidId
 from typing import Annotated
-from datetime import datetime, time, date
-import json
+from datetime import datetime
+import asyncio
+import orjson
+import os
 import random
 import logging
 
+from cachetools import TTLCache
+from pymongo import ReturnDocument
+
 router = APIRouter(prefix="/api/bookings", tags=["bookings"])
 logger = logging.getLogger(__name__)
 
+# Bound once at import — lifespan connects Mongo before routers load, so
+# handlers skip the per-request name lookup
+bookings_collection = get_async_collection("bookings")
+patients_collection = get_async_collection("patients")
+hospitals_collection = get_async_collection("hospitals")
+users_collection = get_async_collection("users")
+
+# Role gates, frozen once at import
+_booking_creators = require_roles(UserRole.SUPERADMIN, UserRole.DISPATCHER, UserRole.HOSPITAL_STAFF)
+_dispatch_only = require_roles(UserRole.SUPERADMIN, UserRole.DISPATCHER)
+_emergency_escalators = require_roles(UserRole.SUPERADMIN, UserRole.DISPATCHER, UserRole.DOCTOR)
+
 # Import NotificationService with fallback
 try:
     from utils.notification import NotificationService
@@ -36,34 +58,148 @@ except ImportError:
         async def send_system_notification(users, title, message, notification_type="info"):
             print(f"📢 MOCK SYSTEM: {title}")
 
+# With several uvicorn workers each process holds its own connection
+# table, so a broadcast from the worker that served the write would only
+# reach that worker's sockets. Set REDIS_URL to route broadcasts through
+# a pub/sub channel that every worker subscribes to; unset (the
+# single-worker default) broadcasts stay in-process.
+REDIS_URL = os.getenv("REDIS_URL")
+BROADCAST_CHANNEL = "bookings:broadcast"
+
 class ConnectionManager:
+    # Per-connection outbound queue: broadcast only enqueues, and a
+    # dedicated writer task per socket drains its queue at whatever pace
+    # that client can sustain. A consumer that falls 1000 messages
+    # behind is evicted instead of buffering without bound.
+    QUEUE_SIZE = 1000
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        self._redis = None
+        self._subscriber: Optional[asyncio.Task] = None
+
+    async def start_pubsub(self):
+        if not REDIS_URL:
+            return
+        try:
+            import redis.asyncio as aioredis
+            self._redis = aioredis.from_url(REDIS_URL)
+            self._subscriber = asyncio.create_task(self._listen())
+            logger.info("Websocket broadcasts publishing via Redis pub/sub")
+        except Exception as e:
+            logger.error("Redis pub/sub unavailable, broadcasts stay in-process: %s", e)
+            self._redis = None
+
+    async def stop_pubsub(self):
+        if self._subscriber is not None:
+            self._subscriber.cancel()
+            self._subscriber = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def _listen(self):
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(BROADCAST_CHANNEL)
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                self._fan_local(message["data"])
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None:
+            writer.cancel()
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        try:
+            while True:
+                await websocket.send_bytes(await queue.get())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket)
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
-    async def broadcast(self, message: str):
-        disconnected_connections = []
-        for connection in self.active_connections:
+    async def broadcast(self, message: dict):
+        # Encode once; every queue holds a reference to the same bytes
+        # object, so N clients cost one serialization instead of N.
+        payload = orjson.dumps(message)
+        if self._redis is not None:
+            # Every worker's _listen task (including this one's) fans
+            # the payload to its local sockets
+            await self._redis.publish(BROADCAST_CHANNEL, payload)
+        else:
+            self._fan_local(payload)
+
+    def _fan_local(self, payload: bytes):
+        # Wait-free: N put_nowait calls, no socket I/O
+        for websocket, queue in list(self.active_connections.items()):
             try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected_connections.append(connection)
-        
-        for connection in disconnected_connections:
-            self.disconnect(connection)
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                logger.warning("Evicting slow websocket consumer")
+                self.disconnect(websocket)
 
 manager = ConnectionManager()
 
+def orjson_text(payload: dict) -> str:
+    """Encode a websocket payload with orjson (~4x stdlib json)."""
+    return orjson.dumps(payload).decode()
+
+# The pong payload never varies — encode it once at import
+_PONG = orjson.dumps({"type": "pong", "message": "WebSocket connection active"})
+
+# Dashboards poll the count/stats endpoints every few seconds; the
+# numbers change at booking-write frequency, so serve a 10s-stale copy
+# and drop it whenever a handler writes to the collection
+_stats_cache: TTLCache = TTLCache(maxsize=4, ttl=10)
+
+def _invalidate_stats_cache():
+    _stats_cache.clear()
+    # The dashboard caches its /stats aggregations too; imported lazily
+    # to keep the router modules free of import-order coupling
+    from routes.dashboard import invalidate_stats_cache
+    invalidate_stats_cache()
+
+# Everything the Booking response model needs and nothing more — list
+# pages skip whatever else (notes, audit blobs) a document accumulates
+_BOOKING_PROJECTION = {
+    "booking_id": 1, "status": 1, "urgency": 1, "patient_id": 1,
+    "origin_hospital_id": 1, "destination_hospital_id": 1,
+    "preferred_date": 1, "preferred_time": 1, "required_equipment": 1,
+    "special_instructions": 1, "assigned_crew_ids": 1, "assigned_aircraft_id": 1,
+    "estimated_cost": 1, "actual_cost": 1, "flight_duration": 1,
+    "created_by": 1, "created_at": 1, "updated_at": 1,
+}
+
+def _parse_booking_id(booking_id: str) -> ObjectId:
+    # One parse instead of is_valid() + ObjectId() running the same
+    # hex decode twice
+    try:
+        return ObjectId(booking_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid booking ID format")
+
+async def _fan_out(*sends):
+    """Run notification/broadcast coroutines concurrently.
+
+    Handlers schedule this via BackgroundTasks so the HTTP response isn't
+    held up by fan-out work; a failure in one send must not cancel the
+    others, so exceptions are collected and logged instead of raised."""
+    for result in await asyncio.gather(*sends, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.error(f"Notification fan-out failed: {result}")
+
 def calculate_estimated_cost(booking_data: dict) -> float:
     base_cost = 5000
     urgency_multiplier = {
@@ -86,147 +222,107 @@ def calculate_actual_cost(booking_data: dict, flight_duration: int) -> float:
     equipment_cost = len(booking_data.get("required_equipment", [])) * 500
     return (base_rate * flight_duration * urgency_multiplier.get(booking_data.get("urgency", "stable"), 1.0)) + equipment_cost
 
+# Own PRNG instance: skips the lock on the shared module-level random
+# state that uvicorn threadpool workers would otherwise contend on
+_rng = random.Random()
+
 def calculate_flight_duration() -> int:
-    return random.randint(30, 180)
+    return _rng.randint(30, 180)
+
+# Role filters serialized to their raw values once, so each query skips
+# rebuilding the lists and PyMongo's per-member enum coercion
+_DISPATCH_ACTIONS = frozenset({"created", "updated", "emergency"})
+_DISPATCHER_ROLE_VALUES = [
+    r.value for r in (UserRole.DISPATCHER, UserRole.SUPERADMIN, UserRole.AIRLINE_COORDINATOR)
+]
+_MEDICAL_ROLE_VALUES = [r.value for r in (UserRole.DOCTOR, UserRole.PARAMEDIC)]
 
 async def get_notification_recipients(booking: dict, current_user: User, action: str) -> List[User]:
-    users_collection = get_collection("users")
-    recipients = []
-    
+
     try:
-        recipients.append(current_user)
-        
-        if action in ["created", "updated", "emergency"]:
-            dispatchers = users_collection.find({
-                "role": {"$in": [UserRole.DISPATCHER, UserRole.SUPERADMIN, UserRole.AIRLINE_COORDINATOR]},
-                "is_active": True
-            })
-            recipients.extend([User(**user) for user in dispatchers])
-        
+        # Merge both role groups into one $in and fetch them with a
+        # single query; keying the dict by _id dedups for free, so no
+        # User is constructed just to be thrown away
+        roles = []
+        if action in _DISPATCH_ACTIONS:
+            roles += _DISPATCHER_ROLE_VALUES
         if action == "emergency" or booking.get("urgency") == "critical":
-            medical_staff = users_collection.find({
-                "role": {"$in": [UserRole.DOCTOR, UserRole.PARAMEDIC]},
-                "is_active": True
-            })
-            recipients.extend([User(**user) for user in medical_staff])
-        
-        unique_recipients = []
-        seen_ids = set()
-        for recipient in recipients:
-            if str(recipient.id) not in seen_ids:
-                unique_recipients.append(recipient)
-                seen_ids.add(str(recipient.id))
-        
-        return unique_recipients
-        
+            roles += _MEDICAL_ROLE_VALUES
+
+        recipients = {str(current_user.id): current_user}
+        if roles:
+            cursor = users_collection.find({"role": {"$in": roles}, "is_active": True})
+            async for user in cursor:
+                user_id = str(user["_id"])
+                if user_id not in recipients:
+                    recipients[user_id] = User(**user)
+
+        return list(recipients.values())
+
     except Exception as e:
         logger.error(f"Error getting notification recipients: {e}")
         return [current_user]
 
-def normalize_equipment_data(equipment_list: List) -> List[EquipmentType]:
-    """Convert equipment data to proper enum values"""
-    normalized_equipment = []
-    for equipment in equipment_list:
-        if isinstance(equipment, EquipmentType):
-            normalized_equipment.append(equipment)
-        elif isinstance(equipment, str):
-            # Normalize the string
-            normalized = equipment.lower().replace(' ', '_')
-            try:
-                normalized_equipment.append(EquipmentType(normalized))
-            except ValueError:
-                # Handle common variations
-                if 'ventilator' in normalized:
-                    normalized_equipment.append(EquipmentType.VENTILATOR)
-                elif 'ecg' in normalized or 'monitor' in normalized:
-                    normalized_equipment.append(EquipmentType.ECG_MONITOR)
-                elif 'defib' in normalized:
-                    normalized_equipment.append(EquipmentType.DEFIBRILLATOR)
-                elif 'oxygen' in normalized:
-                    normalized_equipment.append(EquipmentType.OXYGEN_SUPPLY)
-                elif 'infusion' in normalized:
-                    normalized_equipment.append(EquipmentType.INFUSION_PUMP)
-                elif 'patient' in normalized:
-                    normalized_equipment.append(EquipmentType.PATIENT_MONITOR)
-                else:
-                    logger.warning(f"Unknown equipment type: {equipment}")
-        else:
-            logger.warning(f"Invalid equipment type: {equipment}")
-    
-    return normalized_equipment
+_MIDNIGHT = datetime.min.time()
 
 def convert_booking_data(booking_data: dict) -> dict:
-    """Convert booking data from database format to API format"""
+    """Convert booking data from database format to API format.
+
+    Only renames/defaults keys — the date, time and equipment coercions
+    live in Booking's field_validators now, so Pydantic applies them
+    once during model validation instead of this running a Python
+    massaging pass per row first."""
     converted_data = dict(booking_data)
     converted_data["id"] = str(booking_data["_id"])
-    
-    # Handle missing required fields with defaults
     converted_data.setdefault("origin_hospital_id", "unknown")
     converted_data.setdefault("destination_hospital_id", "unknown")
-    
-    # Convert date/time fields
-    if 'preferred_date' in converted_data:
-        if isinstance(converted_data['preferred_date'], datetime):
-            converted_data['preferred_date'] = converted_data['preferred_date'].date()
-        elif converted_data['preferred_date'] is None:
-            converted_data['preferred_date'] = date.today()
-    else:
-        converted_data['preferred_date'] = date.today()
-    
-    if 'preferred_time' in converted_data:
-        if isinstance(converted_data['preferred_time'], str):
-            try:
-                converted_data['preferred_time'] = datetime.strptime(converted_data['preferred_time'], '%H:%M:%S').time()
-            except ValueError:
-                try:
-                    converted_data['preferred_time'] = datetime.strptime(converted_data['preferred_time'], '%H:%M').time()
-                except ValueError:
-                    converted_data['preferred_time'] = time(12, 0)
-        elif converted_data['preferred_time'] is None:
-            converted_data['preferred_time'] = time(12, 0)
-    else:
-        converted_data['preferred_time'] = time(12, 0)
-    
-    # Normalize equipment data
-    if 'required_equipment' in converted_data and converted_data['required_equipment']:
-        converted_data['required_equipment'] = normalize_equipment_data(converted_data['required_equipment'])
-    
+    converted_data.setdefault("preferred_date", None)
+    converted_data.setdefault("preferred_time", None)
     return converted_data
 
 # CREATE - Create new booking
 @router.post("/", response_model=Booking, status_code=status.HTTP_201_CREATED)
 async def create_booking(
     booking_data: BookingCreate,
-    current_user: Annotated[User, Depends(get_current_active_user)]
+    current_user: Annotated[User, Depends(_booking_creators)],
+    background_tasks: BackgroundTasks
 ):
     """
     Create a new booking
     """
-    allowed_roles = [UserRole.SUPERADMIN, UserRole.DISPATCHER, UserRole.HOSPITAL_STAFF]
-    if current_user.role not in allowed_roles:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
     try:
-        bookings_collection = get_collection("bookings")
-        patients_collection = get_collection("patients")
-        
-        booking_dict = booking_data.dict()
-        
-        # Get patient name
-        patient_name = "Unknown Patient"
-        if booking_dict.get("patient_id"):
-            patient = patients_collection.find_one({"_id": ObjectId(booking_dict["patient_id"])})
-            if patient:
-                patient_name = patient.get("full_name", "Unknown Patient")
-        
+
+        booking_dict = booking_data.model_dump()
+        origin_h_id = booking_dict.get("origin_hospital_id")
+
+        # The patient name, booking-id prefix and per-hospital sequence
+        # count come from three unrelated queries — run them concurrently
+        async def _patient_name() -> str:
+            if booking_dict.get("patient_id"):
+                patient = await patients_collection.find_one({"_id": ObjectId(booking_dict["patient_id"])})
+                if patient:
+                    return patient.get("full_name", "Unknown Patient")
+            return "Unknown Patient"
+
+        async def _booking_prefix() -> str:
+            if origin_h_id and ObjectId.is_valid(origin_h_id):
+                origin_h = await hospitals_collection.find_one({"_id": ObjectId(origin_h_id)})
+                if origin_h:
+                    h_name = origin_h.get("hospital_name", "HOSP")
+                    return h_name.split()[0].upper()
+            return "GEN"
+
+        patient_name, prefix, count = await asyncio.gather(
+            _patient_name(),
+            _booking_prefix(),
+            bookings_collection.count_documents({"origin_hospital_id": origin_h_id}),
+        )
+
         # Prepare booking data for database
         if 'preferred_date' in booking_dict and booking_dict['preferred_date']:
             booking_dict['preferred_date'] = datetime.combine(
-                booking_dict['preferred_date'], 
-                datetime.min.time()
+                booking_dict['preferred_date'],
+                _MIDNIGHT
             )
         
         if 'preferred_time' in booking_dict and booking_dict['preferred_time']:
@@ -247,53 +343,45 @@ async def create_booking(
         if booking_dict.get("estimated_cost") is None:
             booking_dict["estimated_cost"] = calculate_estimated_cost(booking_dict)
 
-        # Generate custom booking_id
-        origin_h_id = booking_dict.get("origin_hospital_id")
-        hospitals_collection = get_collection("hospitals")
-        prefix = "GEN"
-        if origin_h_id and ObjectId.is_valid(origin_h_id):
-            origin_h = hospitals_collection.find_one({"_id": ObjectId(origin_h_id)})
-            if origin_h:
-                h_name = origin_h.get("hospital_name", "HOSP")
-                prefix = h_name.split()[0].upper()
-        
-        count = bookings_collection.count_documents({"origin_hospital_id": origin_h_id})
         booking_dict["booking_id"] = f"BK-{prefix}-{str(count + 1).zfill(3)}"
 
         # Insert into database
-        result = bookings_collection.insert_one(booking_dict)
+        result = await bookings_collection.insert_one(booking_dict)
         booking_id = str(result.inserted_id)
+        _invalidate_stats_cache()
         
         # Retrieve the created booking
-        created_booking = bookings_collection.find_one({"_id": ObjectId(booking_id)})
+        created_booking = await bookings_collection.find_one({"_id": result.inserted_id})
         booking_response = convert_booking_data(created_booking)
         
         # Send notifications
         recipients = await get_notification_recipients(booking_response, current_user, "created")
         notification_message = f"New booking created for patient {patient_name}. Urgency: {booking_dict.get('urgency', 'unknown')}. Status: Pending"
         
-        await NotificationService.send_booking_notification(
-            booking=Booking(**booking_response),
-            recipients=recipients,
-            message=notification_message,
-            notification_type="info"
-        )
-        
+        sends = [
+            NotificationService.send_booking_notification(
+                booking=Booking(**booking_response),
+                recipients=recipients,
+                message=notification_message,
+                notification_type="info"
+            ),
+            manager.broadcast({
+                "type": "booking_created",
+                "booking_id": booking_id,
+                "message": "New booking created",
+                "urgency": booking_dict.get("urgency"),
+                "patient_name": patient_name
+            }),
+        ]
+
         if booking_dict.get("urgency") == "critical":
             emergency_message = f"CRITICAL PATIENT: {patient_name} requires immediate air ambulance transport from {booking_dict.get('pickup_location', 'Unknown')}"
-            await NotificationService.send_emergency_alert(
+            sends.append(NotificationService.send_emergency_alert(
                 booking=Booking(**booking_response),
                 message=emergency_message
-            )
-        
-        # Broadcast via WebSocket
-        await manager.broadcast(json.dumps({
-            "type": "booking_created",
-            "booking_id": booking_id,
-            "message": "New booking created",
-            "urgency": booking_dict.get("urgency"),
-            "patient_name": patient_name
-        }))
+            ))
+
+        background_tasks.add_task(_fan_out, *sends)
         
         logger.info(f"✅ Booking created: {booking_id} by user {current_user.email}")
         return Booking(**booking_response)
@@ -303,7 +391,7 @@ async def create_booking(
         raise HTTPException(status_code=500, detail="Error creating booking")
 
 # READ - Get all bookings
-@router.get("/", response_model=List[Booking])
+@router.get("/")
 async def get_bookings(
     current_user: Annotated[User, Depends(get_current_active_user)],
     status: Optional[BookingStatus] = None,
@@ -311,40 +399,45 @@ async def get_bookings(
     limit: int = 100
 ):
     """
-    Get all bookings with optional filtering
+    Get all bookings with optional filtering, streamed as NDJSON
+
+    One JSON document per line: rows go out as Mongo produces them
+    instead of accumulating `limit` Booking instances and serializing
+    the whole list at the end, so peak memory stays flat and the first
+    row reaches the client after one document of latency.
     """
-    try:
-        bookings_collection = get_collection("bookings")
-        query = {}
-        
-        # Filter by status if provided
-        if status:
-            query["status"] = status
-        
-        # Role-based filtering
-        if current_user.role == UserRole.HOSPITAL_STAFF:
-            query["created_by"] = str(current_user.id)
-        elif current_user.role in [UserRole.DOCTOR, UserRole.PARAMEDIC]:
-            # Medical staff can only see critical/urgent bookings
-            query["urgency"] = {"$in": ["critical", "urgent"]}
-        
-        cursor = bookings_collection.find(query).sort("created_at", -1).skip(skip).limit(limit)
-        booking_list = []
-        
-        for booking in cursor:
-            try:
-                converted_booking = convert_booking_data(booking)
-                booking_list.append(Booking(**converted_booking))
-            except Exception as e:
-                logger.error(f"❌ Error parsing booking {booking.get('_id')}: {e}")
-                continue
-        
-        logger.info(f"📋 Retrieved {len(booking_list)} bookings for user {current_user.email}")
-        return booking_list
-    
-    except Exception as e:
-        logger.error(f"❌ Error retrieving bookings: {e}")
-        raise HTTPException(status_code=500, detail="Error retrieving bookings")
+    query = {}
+
+    # Filter by status if provided
+    if status:
+        query["status"] = status
+
+    # Role-based filtering
+    if current_user.role == UserRole.HOSPITAL_STAFF:
+        query["created_by"] = str(current_user.id)
+    elif current_user.role in [UserRole.DOCTOR, UserRole.PARAMEDIC]:
+        # Medical staff can only see critical/urgent bookings
+        query["urgency"] = {"$in": ["critical", "urgent"]}
+
+    cursor = bookings_collection.find(query, _BOOKING_PROJECTION).sort("created_at", -1).skip(skip).limit(limit)
+
+    async def generate():
+        count = 0
+        try:
+            async for booking in cursor:
+                try:
+                    converted_booking = convert_booking_data(booking)
+                    row = Booking(**converted_booking).model_dump(mode="json")
+                except Exception as e:
+                    logger.error(f"❌ Error parsing booking {booking.get('_id')}: {e}")
+                    continue
+                count += 1
+                yield orjson.dumps(row) + b"\n"
+        except Exception as e:
+            logger.error(f"❌ Error retrieving bookings: {e}")
+        logger.info(f"📋 Retrieved {count} bookings for user {current_user.email}")
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 # READ - Get single booking by ID
 @router.get("/{booking_id}", response_model=BookingWithDetails)
@@ -353,59 +446,82 @@ async def get_booking(booking_id: str, current_user: Annotated[User, Depends(get
     Get a specific booking by ID with detailed information
     """
     try:
-        bookings_collection = get_collection("bookings")
-        patients_collection = get_collection("patients")
-        hospitals_collection = get_collection("hospitals")
-        
-        if not ObjectId.is_valid(booking_id):
-            raise HTTPException(status_code=400, detail="Invalid booking ID format")
-        
-        booking_data = bookings_collection.find_one({"_id": ObjectId(booking_id)})
-        
-        if not booking_data:
+        oid = _parse_booking_id(booking_id)
+
+        # One aggregation joins patient and both hospitals server-side —
+        # a single round trip instead of four sequential queries. The
+        # foreign keys are stored as strings, so each $lookup converts
+        # them to ObjectId first (onError absorbs "unknown" placeholders).
+        def _join(from_coll: str, local_field: str, alias: str, projection: dict):
+            return {"$lookup": {
+                "from": from_coll,
+                "let": {"fk": {"$convert": {
+                    "input": f"${local_field}", "to": "objectId",
+                    "onError": None, "onNull": None
+                }}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$_id", "$$fk"]}}},
+                    {"$project": projection},
+                ],
+                "as": alias,
+            }}
+
+        _HOSPITAL_FIELDS = {"name": 1, "address": 1, "contact_number": 1}
+        pipeline = [
+            {"$match": {"_id": oid}},
+            _join("patients", "patient_id", "patient_doc", {
+                "full_name": 1, "medical_record_number": 1,
+                "acuity_level": 1, "age": 1, "condition": 1
+            }),
+            _join("hospitals", "origin_hospital_id", "origin_doc", _HOSPITAL_FIELDS),
+            _join("hospitals", "destination_hospital_id", "destination_doc", _HOSPITAL_FIELDS),
+            {"$unwind": {"path": "$patient_doc", "preserveNullAndEmptyArrays": True}},
+            {"$unwind": {"path": "$origin_doc", "preserveNullAndEmptyArrays": True}},
+            {"$unwind": {"path": "$destination_doc", "preserveNullAndEmptyArrays": True}},
+        ]
+        results = await bookings_collection.aggregate(pipeline).to_list(length=1)
+
+        if not results:
             raise HTTPException(status_code=404, detail="Booking not found")
-        
+        booking_data = results[0]
+
         # Check permissions
-        if (current_user.role == UserRole.HOSPITAL_STAFF and 
+        if (current_user.role == UserRole.HOSPITAL_STAFF and
             booking_data.get("created_by") != str(current_user.id)):
             raise HTTPException(status_code=403, detail="Not enough permissions")
-        
+
+        patient = booking_data.pop("patient_doc", None)
+        origin_hospital = booking_data.pop("origin_doc", None)
+        dest_hospital = booking_data.pop("destination_doc", None)
+
         booking_dict = convert_booking_data(booking_data)
-        
-        # Add patient details
-        if booking_dict.get("patient_id"):
-            patient = patients_collection.find_one({"_id": ObjectId(booking_dict["patient_id"])})
-            if patient:
-                booking_dict["patient_details"] = {
-                    "id": str(patient["_id"]),
-                    "full_name": patient.get("full_name", "Unknown"),
-                    "medical_record_number": patient.get("medical_record_number", ""),
-                    "acuity_level": patient.get("acuity_level", "unknown"),
-                    "age": patient.get("age"),
-                    "condition": patient.get("condition", "")
-                }
-        
-        # Add hospital details
-        if booking_dict.get("origin_hospital_id") and booking_dict["origin_hospital_id"] != "unknown":
-            origin_hospital = hospitals_collection.find_one({"_id": ObjectId(booking_dict["origin_hospital_id"])})
-            if origin_hospital:
-                booking_dict["origin_hospital_details"] = {
-                    "id": str(origin_hospital["_id"]),
-                    "name": origin_hospital.get("name", "Unknown Hospital"),
-                    "address": origin_hospital.get("address", ""),
-                    "contact_number": origin_hospital.get("contact_number", "")
-                }
-        
-        if booking_dict.get("destination_hospital_id") and booking_dict["destination_hospital_id"] != "unknown":
-            dest_hospital = hospitals_collection.find_one({"_id": ObjectId(booking_dict["destination_hospital_id"])})
-            if dest_hospital:
-                booking_dict["destination_hospital_details"] = {
-                    "id": str(dest_hospital["_id"]),
-                    "name": dest_hospital.get("name", "Unknown Hospital"),
-                    "address": dest_hospital.get("address", ""),
-                    "contact_number": dest_hospital.get("contact_number", "")
-                }
-        
+
+        if patient:
+            booking_dict["patient_details"] = {
+                "id": str(patient["_id"]),
+                "full_name": patient.get("full_name", "Unknown"),
+                "medical_record_number": patient.get("medical_record_number", ""),
+                "acuity_level": patient.get("acuity_level", "unknown"),
+                "age": patient.get("age"),
+                "condition": patient.get("condition", "")
+            }
+
+        if origin_hospital:
+            booking_dict["origin_hospital_details"] = {
+                "id": str(origin_hospital["_id"]),
+                "name": origin_hospital.get("name", "Unknown Hospital"),
+                "address": origin_hospital.get("address", ""),
+                "contact_number": origin_hospital.get("contact_number", "")
+            }
+
+        if dest_hospital:
+            booking_dict["destination_hospital_details"] = {
+                "id": str(dest_hospital["_id"]),
+                "name": dest_hospital.get("name", "Unknown Hospital"),
+                "address": dest_hospital.get("address", ""),
+                "contact_number": dest_hospital.get("contact_number", "")
+            }
+
         return BookingWithDetails(**booking_dict)
     
     except HTTPException:
@@ -419,37 +535,32 @@ async def get_booking(booking_id: str, current_user: Annotated[User, Depends(get
 async def update_booking(
     booking_id: str,
     booking_update: BookingUpdate,
-    current_user: Annotated[User, Depends(get_current_active_user)]
+    current_user: Annotated[User, Depends(_dispatch_only)],
+    background_tasks: BackgroundTasks
 ):
     """
     Update an existing booking
     """
-    allowed_roles = [UserRole.SUPERADMIN, UserRole.DISPATCHER]
-    if current_user.role not in allowed_roles:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
     try:
-        bookings_collection = get_collection("bookings")
-        patients_collection = get_collection("patients")
-        
-        if not ObjectId.is_valid(booking_id):
-            raise HTTPException(status_code=400, detail="Invalid booking ID format")
-        
-        current_booking = bookings_collection.find_one({"_id": ObjectId(booking_id)})
+        oid = _parse_booking_id(booking_id)
+
+        # Fetch only what the completion/notification logic reads — the
+        # full post-image comes back from find_one_and_update below
+        current_booking = await bookings_collection.find_one(
+            {"_id": oid},
+            {"status": 1, "patient_id": 1, "urgency": 1, "required_equipment": 1}
+        )
         if not current_booking:
             raise HTTPException(status_code=404, detail="Booking not found")
         
         # Get patient name for notifications
         patient_name = "Unknown Patient"
         if current_booking.get("patient_id"):
-            patient = patients_collection.find_one({"_id": ObjectId(current_booking["patient_id"])})
+            patient = await patients_collection.find_one({"_id": ObjectId(current_booking["patient_id"])})
             if patient:
                 patient_name = patient.get("full_name", "Unknown Patient")
         
-        update_data = {k: v for k, v in booking_update.dict(exclude_unset=True).items() if v is not None}
+        update_data = booking_update.model_dump(exclude_unset=True, exclude_none=True)
         
         # Track status changes for notifications
         old_status = current_booking.get("status")
@@ -468,8 +579,8 @@ async def update_booking(
         # Convert date/time fields for database
         if 'preferred_date' in update_data and update_data['preferred_date']:
             update_data['preferred_date'] = datetime.combine(
-                update_data['preferred_date'], 
-                datetime.min.time()
+                update_data['preferred_date'],
+                _MIDNIGHT
             )
         
         if 'preferred_time' in update_data and update_data['preferred_time']:
@@ -481,48 +592,49 @@ async def update_booking(
         
         update_data["updated_at"] = datetime.utcnow()
         
-        # Perform update
-        result = bookings_collection.update_one(
-            {"_id": ObjectId(booking_id)},
-            {"$set": update_data}
+        # Apply the update and read the post-image in one round trip
+        updated_booking = await bookings_collection.find_one_and_update(
+            {"_id": oid},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
         
-        if result.modified_count == 0:
-            raise HTTPException(status_code=404, detail="Booking not found or no changes made")
+        if updated_booking is None:
+            raise HTTPException(status_code=404, detail="Booking not found")
+        _invalidate_stats_cache()
         
-        # Retrieve updated booking
-        updated_booking = bookings_collection.find_one({"_id": ObjectId(booking_id)})
         booking_response = convert_booking_data(updated_booking)
         
-        # Send notifications for status changes
+        # Send notifications for status changes and the broadcast together
+        sends = [manager.broadcast({
+            "type": "booking_updated",
+            "booking_id": booking_response["id"],
+            "message": f"Booking {booking_response['id']} updated",
+            "status": new_status if status_changed else None,
+            "patient_name": patient_name
+        })]
+
         if status_changed:
             recipients = await get_notification_recipients(booking_response, current_user, "status_change")
             status_message = f"Booking status changed for patient {patient_name}: {old_status} → {new_status}"
-            
-            await NotificationService.send_booking_notification(
+
+            sends.append(NotificationService.send_booking_notification(
                 booking=Booking(**booking_response),
                 recipients=recipients,
                 message=status_message,
                 notification_type="info" if new_status != "cancelled" else "warning"
-            )
-            
+            ))
+
             if new_status == BookingStatus.COMPLETED:
                 completion_message = f"Booking completed for patient {patient_name}. Flight duration: {booking_response.get('flight_duration', 0)} mins. Cost: ${booking_response.get('actual_cost', 0):.2f}"
-                await NotificationService.send_booking_notification(
+                sends.append(NotificationService.send_booking_notification(
                     booking=Booking(**booking_response),
                     recipients=recipients,
                     message=completion_message,
                     notification_type="success"
-                )
-        
-        # Broadcast update
-        await manager.broadcast(json.dumps({
-            "type": "booking_updated",
-            "booking_id": booking_response["id"],
-            "message": f"Booking {booking_response['id']} updated",
-            "status": new_status if status_changed else None,
-            "patient_name": patient_name
-        }))
+                ))
+
+        background_tasks.add_task(_fan_out, *sends)
         
         logger.info(f"✅ Booking updated: {booking_response['id']} by user {current_user.email}")
         return Booking(**booking_response)
@@ -537,61 +649,53 @@ async def update_booking(
 @router.delete("/{booking_id}", status_code=status.HTTP_200_OK)
 async def delete_booking(
     booking_id: str,
-    current_user: Annotated[User, Depends(get_current_active_user)]
+    current_user: Annotated[User, Depends(_dispatch_only)],
+    background_tasks: BackgroundTasks
 ):
     """
     Delete a booking
     """
-    allowed_roles = [UserRole.SUPERADMIN, UserRole.DISPATCHER]
-    if current_user.role not in allowed_roles:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
     try:
-        bookings_collection = get_collection("bookings")
-        patients_collection = get_collection("patients")
-        
-        if not ObjectId.is_valid(booking_id):
-            raise HTTPException(status_code=400, detail="Invalid booking ID format")
-        
-        booking_data = bookings_collection.find_one({"_id": ObjectId(booking_id)})
+        oid = _parse_booking_id(booking_id)
+
+        booking_data = await bookings_collection.find_one({"_id": oid})
         if not booking_data:
             raise HTTPException(status_code=404, detail="Booking not found")
         
         # Get patient name for notification
         patient_name = "Unknown Patient"
         if booking_data.get("patient_id"):
-            patient = patients_collection.find_one({"_id": ObjectId(booking_data["patient_id"])})
+            patient = await patients_collection.find_one({"_id": ObjectId(booking_data["patient_id"])})
             if patient:
                 patient_name = patient.get("full_name", "Unknown Patient")
         
         # Delete booking
-        result = bookings_collection.delete_one({"_id": ObjectId(booking_id)})
+        result = await bookings_collection.delete_one({"_id": oid})
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Booking not found")
+        _invalidate_stats_cache()
         
         # Send notification
         recipients = await get_notification_recipients(booking_data, current_user, "deleted")
         delete_message = f"Booking for patient {patient_name} has been deleted"
         
-        await NotificationService.send_booking_notification(
-            booking=Booking(**convert_booking_data(booking_data)),
-            recipients=recipients,
-            message=delete_message,
-            notification_type="warning"
+        background_tasks.add_task(
+            _fan_out,
+            NotificationService.send_booking_notification(
+                booking=Booking(**convert_booking_data(booking_data)),
+                recipients=recipients,
+                message=delete_message,
+                notification_type="warning"
+            ),
+            manager.broadcast({
+                "type": "booking_deleted",
+                "booking_id": booking_id,
+                "message": "Booking deleted",
+                "patient_name": patient_name
+            }),
         )
         
-        # Broadcast deletion
-        await manager.broadcast(json.dumps({
-            "type": "booking_deleted",
-            "booking_id": booking_id,
-            "message": "Booking deleted",
-            "patient_name": patient_name
-        }))
-        
         logger.info(f"🗑️ Booking deleted: {booking_id} by user {current_user.email}")
         return {"message": "Booking deleted successfully"}
     
@@ -605,35 +709,28 @@ async def delete_booking(
 @router.put("/{booking_id}/emergency")
 async def mark_booking_emergency(
     booking_id: str,
-    current_user: Annotated[User, Depends(get_current_active_user)]
+    current_user: Annotated[User, Depends(_emergency_escalators)],
+    background_tasks: BackgroundTasks
 ):
     """
     Mark a booking as emergency/critical
     """
-    allowed_roles = [UserRole.SUPERADMIN, UserRole.DISPATCHER, UserRole.DOCTOR]
-    if current_user.role not in allowed_roles:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
     try:
-        bookings_collection = get_collection("bookings")
-        patients_collection = get_collection("patients")
-        
-        if not ObjectId.is_valid(booking_id):
-            raise HTTPException(status_code=400, detail="Invalid booking ID format")
-        
-        booking_data = bookings_collection.find_one({"_id": ObjectId(booking_id)})
+        oid = _parse_booking_id(booking_id)
+
+        booking_data = await bookings_collection.find_one({"_id": oid})
         if not booking_data:
             raise HTTPException(status_code=404, detail="Booking not found")
         
         patient_name = "Unknown Patient"
         if booking_data.get("patient_id"):
-            patient = patients_collection.find_one({"_id": ObjectId(booking_data["patient_id"])})
+            patient = await patients_collection.find_one({"_id": ObjectId(booking_data["patient_id"])})
             if patient:
                 patient_name = patient.get("full_name", "Unknown Patient")
         
         # Update to critical urgency
-        result = bookings_collection.update_one(
-            {"_id": ObjectId(booking_id)},
+        result = await bookings_collection.update_one(
+            {"_id": oid},
             {"$set": {
                 "urgency": "critical",
                 "updated_at": datetime.utcnow()
@@ -643,26 +740,27 @@ async def mark_booking_emergency(
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="Booking not found")
         
-        updated_booking = bookings_collection.find_one({"_id": ObjectId(booking_id)})
+        updated_booking = await bookings_collection.find_one({"_id": oid})
         booking_response = convert_booking_data(updated_booking)
         
         # Send emergency alert
         emergency_message = f"🚨 EMERGENCY ESCALATION: Patient {patient_name} condition critical. Immediate transport required from {booking_data.get('pickup_location', 'Unknown')} to {booking_data.get('destination', 'Unknown')}"
         
-        await NotificationService.send_emergency_alert(
-            booking=Booking(**booking_response),
-            message=emergency_message
+        background_tasks.add_task(
+            _fan_out,
+            NotificationService.send_emergency_alert(
+                booking=Booking(**booking_response),
+                message=emergency_message
+            ),
+            manager.broadcast({
+                "type": "emergency_alert",
+                "booking_id": booking_id,
+                "message": "Emergency alert triggered",
+                "patient_name": patient_name,
+                "urgency": "critical"
+            }),
         )
         
-        # Broadcast emergency
-        await manager.broadcast(json.dumps({
-            "type": "emergency_alert",
-            "booking_id": booking_id,
-            "message": "Emergency alert triggered",
-            "patient_name": patient_name,
-            "urgency": "critical"
-        }))
-        
         logger.info(f"🚨 Emergency alert triggered for booking {booking_id} by {current_user.email}")
         return {"message": "Emergency alert sent successfully", "booking": Booking(**booking_response)}
     
@@ -675,16 +773,15 @@ async def mark_booking_emergency(
 # Additional endpoints...
 
 @router.get("/pending/count")
-async def get_pending_approvals_count(current_user: Annotated[User, Depends(get_current_active_user)]):
+async def get_pending_approvals_count(current_user: Annotated[User, Depends(_dispatch_only)]):
     """
     Get count of pending bookings
     """
-    if current_user.role not in [UserRole.SUPERADMIN, UserRole.DISPATCHER]:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
     try:
-        bookings_collection = get_collection("bookings")
-        count = bookings_collection.count_documents({"status": "pending"})
+        count = _stats_cache.get("pending_count")
+        if count is None:
+            count = await bookings_collection.count_documents({"status": "pending"})
+            _stats_cache["pending_count"] = count
         logger.info(f"📊 Pending approvals count: {count}")
         return {"pending_approvals_count": count}
     
@@ -693,37 +790,40 @@ async def get_pending_approvals_count(current_user: Annotated[User, Depends(get_
         raise HTTPException(status_code=500, detail="Error getting pending count")
 
 @router.get("/completed/stats")
-async def get_completed_bookings_stats(current_user: Annotated[User, Depends(get_current_active_user)]):
+async def get_completed_bookings_stats(current_user: Annotated[User, Depends(_dispatch_only)]):
     """
     Get statistics for completed bookings
     """
-    if current_user.role not in [UserRole.SUPERADMIN, UserRole.DISPATCHER]:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
     try:
-        bookings_collection = get_collection("bookings")
-        completed_bookings = bookings_collection.find({"status": "completed"})
-        
-        total_revenue = 0
-        total_flight_time = 0
-        booking_count = 0
-        
-        for booking in completed_bookings:
-            total_revenue += booking.get('actual_cost', 0)
-            total_flight_time += booking.get('flight_duration', 0)
-            booking_count += 1
-        
-        avg_flight_time = total_flight_time / booking_count if booking_count > 0 else 0
-        avg_revenue = total_revenue / booking_count if booking_count > 0 else 0
-        
+        cached = _stats_cache.get("completed_stats")
+        if cached is not None:
+            return cached
+
+
+        # Sum and average server-side — one result document back instead
+        # of streaming every completed booking into a Python loop
+        results = await bookings_collection.aggregate([
+            {"$match": {"status": "completed"}},
+            {"$group": {
+                "_id": None,
+                "booking_count": {"$sum": 1},
+                "total_revenue": {"$sum": {"$ifNull": ["$actual_cost", 0]}},
+                "total_flight_time": {"$sum": {"$ifNull": ["$flight_duration", 0]}},
+                "avg_flight_time": {"$avg": {"$ifNull": ["$flight_duration", 0]}},
+                "avg_revenue": {"$avg": {"$ifNull": ["$actual_cost", 0]}},
+            }},
+        ]).to_list(length=1)
+
+        totals = results[0] if results else {}
         stats = {
-            "total_completed": booking_count,
-            "total_revenue": total_revenue,
-            "total_flight_time": total_flight_time,
-            "average_flight_time": round(avg_flight_time, 2),
-            "average_revenue_per_booking": round(avg_revenue, 2)
+            "total_completed": totals.get("booking_count", 0),
+            "total_revenue": totals.get("total_revenue", 0),
+            "total_flight_time": totals.get("total_flight_time", 0),
+            "average_flight_time": round(totals.get("avg_flight_time") or 0, 2),
+            "average_revenue_per_booking": round(totals.get("avg_revenue") or 0, 2)
         }
-        
+        _stats_cache["completed_stats"] = stats
+
         logger.info(f"📊 Completed bookings stats: {stats}")
         return stats
     
@@ -738,7 +838,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
     """
     await manager.connect(websocket)
     try:
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(orjson_text({
             "type": "connection_established",
             "message": f"Connected as client {client_id}"
         }))
@@ -746,16 +846,13 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
         while True:
             data = await websocket.receive_text()
             try:
-                message_data = json.loads(data)
+                message_data = orjson.loads(data)
                 logger.info(f"📡 WebSocket message from {client_id}: {message_data}")
                 
                 if message_data.get("type") == "ping":
-                    await websocket.send_text(json.dumps({
-                        "type": "pong",
-                        "message": "WebSocket connection active"
-                    }))
+                    await websocket.send_bytes(_PONG)
                     
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.warning(f"📡 Invalid JSON from WebSocket client {client_id}")
                 
     except WebSocketDisconnect:
@@ -1,18 +1,69 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List, Optional
-from database.connection import get_collection
-from models.booking import Booking, BookingWithDetails, BookingStatus, EquipmentType
+from database.connection import get_async_collection
+from models.booking import (
+    Booking, BookingWithDetails, BookingStatus, EquipmentType,
+    normalize_equipment_data
+)
 from models.user import User, UserRole
 from routes.auth import get_current_active_user
 from bson import ObjectId
 from typing import Annotated
 from datetime import datetime, time, date, timedelta
+from cachetools import TTLCache
+import asyncio
 import logging
+import re
 import traceback
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 logger = logging.getLogger(__name__)
 
+# Bound once at import — lifespan connects Mongo before routers load, so
+# handlers skip the per-request name lookup
+bookings_collection = get_async_collection("bookings")
+patients_collection = get_async_collection("patients")
+aircraft_collection = get_async_collection("aircraft")
+
+# Dashboards poll /stats every few seconds; serve a 10s-stale copy so
+# the aggregations run at most once per window per key. HOSPITAL_STAFF
+# stats are scoped per user, every other role shares one global entry.
+_stats_cache: TTLCache = TTLCache(maxsize=2048, ttl=10)
+# Serializes recomputation so a burst of polls after expiry runs the
+# aggregations once instead of stampeding Mongo
+_stats_lock = asyncio.Lock()
+
+def invalidate_stats_cache() -> None:
+    """Drop cached dashboard stats after a booking or patient write"""
+    _stats_cache.clear()
+
+# Built once at import; handlers .copy() a prototype instead of
+# rebuilding the zero-count literals per request, and format exactly one
+# description template per activity row instead of all six
+_STATUS_COUNT_PROTO = {
+    "pending": 0,
+    "approved": 0,
+    "scheduled": 0,
+    "en_route": 0,
+    "completed": 0,
+    "cancelled": 0,
+}
+
+_URGENCY_COUNT_PROTO = {
+    "critical": 0,
+    "urgent": 0,
+    "stable": 0,
+}
+
+_STATUS_DESCRIPTIONS = {
+    BookingStatus.PENDING: "New booking created for {name}",
+    BookingStatus.APPROVED: "Booking approved for {name}",
+    BookingStatus.SCHEDULED: "Flight scheduled for {name}",
+    BookingStatus.EN_ROUTE: "Transport en route for {name}",
+    BookingStatus.COMPLETED: "Transport completed for {name}",
+    BookingStatus.CANCELLED: "Booking cancelled for {name}",
+}
+
 def safe_object_id_conversion(obj_id):
     """Safely convert to ObjectId"""
     try:
@@ -22,24 +73,9 @@ def safe_object_id_conversion(obj_id):
     except Exception:
         return None
 
-def normalize_equipment_data(equipment_list: List) -> List[EquipmentType]:
-    """Convert equipment data to proper enum values"""
-    if not equipment_list:
-        return []
-    
-    normalized_equipment = []
-    for equipment in equipment_list:
-        try:
-            if isinstance(equipment, EquipmentType):
-                normalized_equipment.append(equipment)
-            elif isinstance(equipment, str):
-                normalized = equipment.lower().replace(' ', '_')
-                normalized_equipment.append(EquipmentType(normalized))
-        except Exception:
-            logger.warning(f"Could not normalize equipment: {equipment}")
-            continue
-    
-    return normalized_equipment
+# Matches "HH:MM" and "HH:MM:SS" in one compiled pass — strptime
+# re-parses its format string and raises on every near-miss
+_TIME_RE = re.compile(r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$")
 
 def convert_booking_data(booking_data: dict) -> dict:
     """Convert booking data from database format to API format"""
@@ -80,19 +116,13 @@ def convert_booking_data(booking_data: dict) -> dict:
             converted_data['preferred_date'] = date.today()
         
         try:
-            if 'preferred_time' in converted_data:
-                if isinstance(converted_data['preferred_time'], str):
-                    for time_format in ['%H:%M:%S', '%H:%M']:
-                        try:
-                            converted_data['preferred_time'] = datetime.strptime(converted_data['preferred_time'], time_format).time()
-                            break
-                        except ValueError:
-                            continue
-                    else:
-                        converted_data['preferred_time'] = time(12, 0)
-                elif converted_data['preferred_time'] is None:
-                    converted_data['preferred_time'] = time(12, 0)
-            else:
+            preferred_time = converted_data.get('preferred_time')
+            if isinstance(preferred_time, str):
+                m = _TIME_RE.match(preferred_time)
+                converted_data['preferred_time'] = (
+                    time(int(m[1]), int(m[2]), int(m[3] or 0)) if m else time(12, 0)
+                )
+            elif preferred_time is None:
                 converted_data['preferred_time'] = time(12, 0)
         except Exception as e:
             logger.warning(f"Error converting preferred_time: {e}")
@@ -112,102 +142,117 @@ def convert_booking_data(booking_data: dict) -> dict:
         logger.error(f"Error in convert_booking_data: {e}")
         return {}
 
-async def get_booking_with_details(booking_data: dict) -> Optional[BookingWithDetails]:
-    """Convert raw booking data to BookingWithDetails with related data"""
+_PATIENT_FIELDS = {
+    "full_name": 1, "medical_record_number": 1, "acuity_level": 1,
+    "age": 1, "condition": 1, "weight": 1, "allergies": 1,
+}
+_HOSPITAL_FIELDS = {"name": 1, "address": 1, "contact_number": 1}
+_AIRCRAFT_FIELDS = {"tail_number": 1, "model": 1, "capacity": 1}
+
+def _lookup_one(from_coll: str, local_field: str, alias: str, projection: dict) -> list:
+    # Booking foreign keys are stored as strings; $convert turns them
+    # into ObjectIds server-side (onError absorbs "unknown" fillers)
+    return [
+        {"$lookup": {
+            "from": from_coll,
+            "let": {"fk": {"$convert": {
+                "input": f"${local_field}", "to": "objectId",
+                "onError": None, "onNull": None
+            }}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$fk"]}}},
+                {"$project": projection},
+            ],
+            "as": alias,
+        }},
+        {"$unwind": {"path": f"${alias}", "preserveNullAndEmptyArrays": True}},
+    ]
+
+# The activity/transfer cards render only these fields; skip the rest
+# (special_instructions, crew arrays, ...) on the wire
+_ACTIVITY_PROJECTION = {
+    "status": 1, "urgency": 1, "updated_at": 1, "created_at": 1,
+    "patient_id": 1, "pickup_location": 1, "destination": 1,
+    "flight_duration": 1, "actual_cost": 1,
+}
+
+def build_booking_details_pipeline(match: dict, limit: int) -> list:
+    """Page of bookings with patient/hospital/aircraft joined server-side.
+
+    One aggregation instead of up to four find_ones per booking — the
+    round-trip count stays constant no matter the page size."""
+    pipeline = [
+        {"$match": match},
+        {"$sort": {"created_at": -1}},
+        {"$limit": limit},
+    ]
+    pipeline += _lookup_one("patients", "patient_id", "patient_doc", _PATIENT_FIELDS)
+    pipeline += _lookup_one("hospitals", "origin_hospital_id", "origin_doc", _HOSPITAL_FIELDS)
+    pipeline += _lookup_one("hospitals", "destination_hospital_id", "destination_doc", _HOSPITAL_FIELDS)
+    pipeline += _lookup_one("aircraft", "assigned_aircraft_id", "aircraft_doc", _AIRCRAFT_FIELDS)
+    return pipeline
+
+def booking_details_from_row(booking_data: dict) -> Optional[BookingWithDetails]:
+    """Build BookingWithDetails from one aggregation row with joined docs"""
     try:
         if not booking_data:
             return None
-            
-        patients_collection = get_collection("patients")
-        hospitals_collection = get_collection("hospitals")
-        aircraft_collection = get_collection("aircraft")
-        
+
+        patient = booking_data.pop("patient_doc", None)
+        origin_hospital = booking_data.pop("origin_doc", None)
+        dest_hospital = booking_data.pop("destination_doc", None)
+        aircraft = booking_data.pop("aircraft_doc", None)
+
         booking_dict = convert_booking_data(booking_data)
         if not booking_dict:
             return None
-        
-        # Add patient details
-        patient_id = booking_dict.get("patient_id")
-        if patient_id and patient_id != "unknown":
-            try:
-                obj_id = safe_object_id_conversion(patient_id)
-                if obj_id:
-                    patient = patients_collection.find_one({"_id": obj_id})
-                    if patient:
-                        booking_dict["patient"] = {
-                            "id": str(patient.get("_id", "")),
-                            "full_name": patient.get("full_name", "Unknown Patient"),
-                            "medical_record_number": patient.get("medical_record_number", ""),
-                            "acuity_level": patient.get("acuity_level", "stable"),
-                            "age": patient.get("age"),
-                            "condition": patient.get("condition", ""),
-                            "weight": patient.get("weight"),
-                            "allergies": patient.get("allergies", [])
-                        }
-            except Exception as e:
-                logger.warning(f"Could not fetch patient details: {e}")
-        
-        # Add origin hospital details
-        origin_hospital_id = booking_dict.get("origin_hospital_id")
-        if origin_hospital_id and origin_hospital_id != "unknown":
-            try:
-                obj_id = safe_object_id_conversion(origin_hospital_id)
-                if obj_id:
-                    origin_hospital = hospitals_collection.find_one({"_id": obj_id})
-                    if origin_hospital:
-                        booking_dict["origin_hospital"] = {
-                            "id": str(origin_hospital.get("_id", "")),
-                            "name": origin_hospital.get("name", "Unknown Hospital"),
-                            "address": origin_hospital.get("address", ""),
-                            "contact_number": origin_hospital.get("contact_number", "")
-                        }
-            except Exception as e:
-                logger.warning(f"Could not fetch origin hospital details: {e}")
-        
-        # Add destination hospital details
-        destination_hospital_id = booking_dict.get("destination_hospital_id")
-        if destination_hospital_id and destination_hospital_id != "unknown":
-            try:
-                obj_id = safe_object_id_conversion(destination_hospital_id)
-                if obj_id:
-                    dest_hospital = hospitals_collection.find_one({"_id": obj_id})
-                    if dest_hospital:
-                        booking_dict["destination_hospital"] = {
-                            "id": str(dest_hospital.get("_id", "")),
-                            "name": dest_hospital.get("name", "Unknown Hospital"),
-                            "address": dest_hospital.get("address", ""),
-                            "contact_number": dest_hospital.get("contact_number", "")
-                        }
-            except Exception as e:
-                logger.warning(f"Could not fetch destination hospital details: {e}")
-        
-        # Add assigned aircraft details
-        assigned_aircraft_id = booking_dict.get("assigned_aircraft_id")
-        if assigned_aircraft_id:
-            try:
-                obj_id = safe_object_id_conversion(assigned_aircraft_id)
-                if obj_id:
-                    aircraft = aircraft_collection.find_one({"_id": obj_id})
-                    if aircraft:
-                        booking_dict["assigned_aircraft"] = {
-                            "id": str(aircraft.get("_id", "")),
-                            "tail_number": aircraft.get("tail_number", ""),
-                            "model": aircraft.get("model", ""),
-                            "capacity": aircraft.get("capacity", 0)
-                        }
-            except Exception as e:
-                logger.warning(f"Could not fetch aircraft details: {e}")
-        
+
+        if patient:
+            booking_dict["patient"] = {
+                "id": str(patient.get("_id", "")),
+                "full_name": patient.get("full_name", "Unknown Patient"),
+                "medical_record_number": patient.get("medical_record_number", ""),
+                "acuity_level": patient.get("acuity_level", "stable"),
+                "age": patient.get("age"),
+                "condition": patient.get("condition", ""),
+                "weight": patient.get("weight"),
+                "allergies": patient.get("allergies", [])
+            }
+
+        if origin_hospital:
+            booking_dict["origin_hospital"] = {
+                "id": str(origin_hospital.get("_id", "")),
+                "name": origin_hospital.get("name", "Unknown Hospital"),
+                "address": origin_hospital.get("address", ""),
+                "contact_number": origin_hospital.get("contact_number", "")
+            }
+
+        if dest_hospital:
+            booking_dict["destination_hospital"] = {
+                "id": str(dest_hospital.get("_id", "")),
+                "name": dest_hospital.get("name", "Unknown Hospital"),
+                "address": dest_hospital.get("address", ""),
+                "contact_number": dest_hospital.get("contact_number", "")
+            }
+
+        if aircraft:
+            booking_dict["assigned_aircraft"] = {
+                "id": str(aircraft.get("_id", "")),
+                "tail_number": aircraft.get("tail_number", ""),
+                "model": aircraft.get("model", ""),
+                "capacity": aircraft.get("capacity", 0)
+            }
+
         # Ensure all optional fields are present
         booking_dict.setdefault("patient", None)
         booking_dict.setdefault("origin_hospital", None)
         booking_dict.setdefault("destination_hospital", None)
         booking_dict.setdefault("assigned_aircraft", None)
-        
+
         return BookingWithDetails(**booking_dict)
-    
+
     except Exception as e:
-        logger.error(f"Error in get_booking_with_details: {e}")
+        logger.error(f"Error in booking_details_from_row: {e}")
         logger.error(traceback.format_exc())
         return None
 
@@ -217,11 +262,28 @@ async def get_dashboard_stats(current_user: Annotated[User, Depends(get_current_
     """
     Get comprehensive dashboard statistics
     """
+    # The str-enum hashes like its raw string, so no .value needed
+    cache_key = (
+        current_user.role,
+        str(current_user.id) if current_user.role == UserRole.HOSPITAL_STAFF else "global",
+    )
+    cached = _stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    async with _stats_lock:
+        cached = _stats_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        stats = await _compute_dashboard_stats(current_user)
+        _stats_cache[cache_key] = stats
+        return stats
+
+
+async def _compute_dashboard_stats(current_user: User) -> dict:
     try:
         logger.info(f"📊 Getting dashboard stats for user: {current_user.email}, role: {current_user.role}")
         
-        bookings_collection = get_collection("bookings")
-        patients_collection = get_collection("patients")
         
         # Base query for role-based filtering
         base_query = {}
@@ -229,46 +291,44 @@ async def get_dashboard_stats(current_user: Annotated[User, Depends(get_current_
             base_query["created_by"] = str(current_user.id)
             logger.info(f"Hospital staff query: {base_query}")
         
-        # Initialize all counts to zero first
-        status_counts = {
-            "pending": 0,
-            "approved": 0,
-            "scheduled": 0,
-            "en_route": 0,
-            "completed": 0,
-            "cancelled": 0
-        }
+        # Buckets missing from the facet output keep the zero defaults
+        status_counts = _STATUS_COUNT_PROTO.copy()
+        urgency_counts = _URGENCY_COUNT_PROTO.copy()
         
-        urgency_counts = {
-            "critical": 0,
-            "urgent": 0,
-            "stable": 0
-        }
+        total_bookings = 0
+        today_bookings = 0
         
         try:
-            # Get total bookings count
-            total_bookings = bookings_collection.count_documents(base_query)
-            logger.info(f"Total bookings: {total_bookings}")
+            # One $facet pipeline computes every booking bucket — total,
+            # per-status, per-urgency and today's count — in a single
+            # round trip and one pass over the collection, instead of
+            # eleven separate count_documents queries
+            today_start = datetime.combine(date.today(), datetime.min.time())
+            today_end = datetime.combine(date.today(), datetime.max.time())
             
-            # Get status counts - handle each status separately to isolate errors
-            for status in status_counts.keys():
-                try:
-                    count = bookings_collection.count_documents({**base_query, "status": status})
-                    status_counts[status] = count
-                    logger.info(f"Status {status}: {count}")
-                except Exception as status_error:
-                    logger.warning(f"Error counting status {status}: {status_error}")
-                    status_counts[status] = 0
+            facet_rows = await bookings_collection.aggregate([
+                {"$match": base_query},
+                {"$facet": {
+                    "total": [{"$count": "n"}],
+                    "by_status": [{"$group": {"_id": "$status", "n": {"$sum": 1}}}],
+                    "by_urgency": [{"$group": {"_id": "$urgency", "n": {"$sum": 1}}}],
+                    "today": [
+                        {"$match": {"created_at": {"$gte": today_start, "$lte": today_end}}},
+                        {"$count": "n"}
+                    ],
+                }},
+            ]).to_list(length=1)
+            facets = facet_rows[0] if facet_rows else {}
             
-            # Get urgency counts - handle each urgency separately
-            for urgency in urgency_counts.keys():
-                try:
-                    count = bookings_collection.count_documents({**base_query, "urgency": urgency})
-                    urgency_counts[urgency] = count
-                    logger.info(f"Urgency {urgency}: {count}")
-                except Exception as urgency_error:
-                    logger.warning(f"Error counting urgency {urgency}: {urgency_error}")
-                    urgency_counts[urgency] = 0
+            total_bookings = facets["total"][0]["n"] if facets.get("total") else 0
+            today_bookings = facets["today"][0]["n"] if facets.get("today") else 0
+            for bucket in facets.get("by_status", []):
+                if bucket["_id"] in status_counts:
+                    status_counts[bucket["_id"]] = bucket["n"]
+            for bucket in facets.get("by_urgency", []):
+                if bucket["_id"] in urgency_counts:
+                    urgency_counts[bucket["_id"]] = bucket["n"]
+            logger.info(f"Booking counts: total={total_bookings} today={today_bookings} by_status={status_counts} by_urgency={urgency_counts}")
             
         except Exception as count_error:
             logger.error(f"Error in counting operations: {count_error}")
@@ -278,21 +338,22 @@ async def get_dashboard_stats(current_user: Annotated[User, Depends(get_current_
         revenue_stats = {}
         if current_user.role in [UserRole.SUPERADMIN, UserRole.DISPATCHER, UserRole.AIRLINE_COORDINATOR]:
             try:
-                completed_bookings = bookings_collection.find({**base_query, "status": BookingStatus.COMPLETED})
-                
-                total_revenue = 0
-                total_estimated_revenue = 0
-                completed_count = 0
-                
-                async for booking in completed_bookings:
-                    try:
-                        total_revenue += float(booking.get('actual_cost', 0) or 0)
-                        total_estimated_revenue += float(booking.get('estimated_cost', 0) or 0)
-                        completed_count += 1
-                    except (ValueError, TypeError) as conv_error:
-                        logger.warning(f"Error converting cost values: {conv_error}")
-                        continue
+                # One $group returns the three numbers the old loop
+                # streamed every completed document to compute
+                revenue_rows = await bookings_collection.aggregate([
+                    {"$match": {**base_query, "status": BookingStatus.COMPLETED}},
+                    {"$group": {
+                        "_id": None,
+                        "total_revenue": {"$sum": {"$ifNull": ["$actual_cost", 0]}},
+                        "total_estimated_revenue": {"$sum": {"$ifNull": ["$estimated_cost", 0]}},
+                        "completed_count": {"$sum": 1},
+                    }},
+                ]).to_list(length=1)
+                totals = revenue_rows[0] if revenue_rows else {}
                 
+                total_revenue = float(totals.get("total_revenue", 0) or 0)
+                total_estimated_revenue = float(totals.get("total_estimated_revenue", 0) or 0)
+                completed_count = totals.get("completed_count", 0)
                 avg_revenue = total_revenue / completed_count if completed_count > 0 else 0
                 
                 revenue_stats = {
@@ -311,24 +372,26 @@ async def get_dashboard_stats(current_user: Annotated[User, Depends(get_current_
                     "average_revenue_per_booking": 0
                 }
         
-        # Patient statistics
+        # Patient statistics — total and per-acuity buckets from one
+        # $facet pipeline instead of four counts
         patient_stats = {}
         try:
             if current_user.role in [UserRole.SUPERADMIN, UserRole.DISPATCHER, UserRole.HOSPITAL_STAFF, UserRole.DOCTOR, UserRole.PARAMEDIC]:
-                total_patients = patients_collection.count_documents({})
+                acuity_counts = {"critical": 0, "urgent": 0, "stable": 0}
+                patient_rows = await patients_collection.aggregate([
+                    {"$facet": {
+                        "total": [{"$count": "n"}],
+                        "by_acuity": [{"$group": {"_id": "$acuity_level", "n": {"$sum": 1}}}],
+                    }},
+                ]).to_list(length=1)
+                patient_facets = patient_rows[0] if patient_rows else {}
                 
-                # Patient acuity levels
-                acuity_counts = {}
-                for acuity in ["critical", "urgent", "stable"]:
-                    try:
-                        count = patients_collection.count_documents({"acuity_level": acuity})
-                        acuity_counts[acuity] = count
-                    except Exception as acuity_error:
-                        logger.warning(f"Error counting acuity {acuity}: {acuity_error}")
-                        acuity_counts[acuity] = 0
+                for bucket in patient_facets.get("by_acuity", []):
+                    if bucket["_id"] in acuity_counts:
+                        acuity_counts[bucket["_id"]] = bucket["n"]
                 
                 patient_stats = {
-                    "total_patients": total_patients,
+                    "total_patients": patient_facets["total"][0]["n"] if patient_facets.get("total") else 0,
                     "acuity_counts": acuity_counts
                 }
                 logger.info(f"Patient stats: {patient_stats}")
@@ -339,28 +402,10 @@ async def get_dashboard_stats(current_user: Annotated[User, Depends(get_current_
                 "acuity_counts": {"critical": 0, "urgent": 0, "stable": 0}
             }
         
-        # Today's bookings
-        today_bookings = 0
-        try:
-            today_start = datetime.combine(date.today(), datetime.min.time())
-            today_end = datetime.combine(date.today(), datetime.max.time())
-            
-            today_bookings = bookings_collection.count_documents({
-                **base_query,
-                "created_at": {
-                    "$gte": today_start,
-                    "$lte": today_end
-                }
-            })
-            logger.info(f"Today's bookings: {today_bookings}")
-        except Exception as today_error:
-            logger.error(f"Error counting today's bookings: {today_error}")
-        
         # Get available aircraft count
         available_aircraft_count = 0
         try:
-            aircraft_collection = get_collection("aircraft")
-            available_aircraft_count = aircraft_collection.count_documents({"status": "available"})
+            available_aircraft_count = await aircraft_collection.count_documents({"status": "available"})
         except Exception as e:
             logger.error(f"Error counting available aircraft: {e}")
 
@@ -398,7 +443,10 @@ async def get_dashboard_stats(current_user: Annotated[User, Depends(get_current_
         )
 
 # READ - Get recent bookings for dashboard
-@router.get("/recent-bookings", response_model=List[BookingWithDetails])
+# No response_model: the rows are validated through BookingWithDetails
+# below, so declaring it again would re-validate and re-serialize the
+# whole page; the dumps go straight to the ORJSONResponse default
+@router.get("/recent-bookings")
 async def get_recent_bookings(
     current_user: Annotated[User, Depends(get_current_active_user)],
     limit: int = 10
@@ -409,7 +457,6 @@ async def get_recent_bookings(
     try:
         logger.info(f"Getting recent bookings for user: {current_user.email}")
         
-        bookings_collection = get_collection("bookings")
         
         # Role-based filtering
         query = {}
@@ -418,17 +465,18 @@ async def get_recent_bookings(
         elif current_user.role in [UserRole.DOCTOR, UserRole.PARAMEDIC]:
             query["urgency"] = {"$in": ["critical", "urgent"]}
         
-        cursor = bookings_collection.find(query).sort("created_at", -1).limit(limit)
+        # to_list drains the cursor in whole batches instead of one
+        # scheduling round trip per document; row-level failures are
+        # already absorbed inside booking_details_from_row
+        rows = await bookings_collection.aggregate(
+            build_booking_details_pipeline(query, limit)
+        ).to_list(length=limit)
         
-        recent_bookings = []
-        async for booking in cursor:
-            try:
-                booking_with_details = await get_booking_with_details(booking)
-                if booking_with_details:
-                    recent_bookings.append(booking_with_details)
-            except Exception as e:
-                logger.error(f"Error processing booking {booking.get('_id')}: {e}")
-                continue
+        recent_bookings = [
+            details.model_dump(mode="json")
+            for booking in rows
+            if (details := booking_details_from_row(booking)) is not None
+        ]
         
         logger.info(f"✅ Retrieved {len(recent_bookings)} recent bookings for user {current_user.email}")
         return recent_bookings
@@ -453,8 +501,6 @@ async def get_activity_transfers(
     try:
         logger.info(f"Getting activity transfers for user: {current_user.email}")
         
-        bookings_collection = get_collection("bookings")
-        patients_collection = get_collection("patients")
         
         # Base query for role-based filtering
         base_query = {}
@@ -463,35 +509,37 @@ async def get_activity_transfers(
         elif current_user.role in [UserRole.DOCTOR, UserRole.PARAMEDIC]:
             base_query["urgency"] = {"$in": ["critical", "urgent"]}
         
+        async def _patient_names(rows: list) -> dict:
+            # One $in query for the whole page instead of a find_one per
+            # row — the lists overlap heavily so this also dedups
+            oids = {
+                oid for row in rows
+                if (oid := safe_object_id_conversion(row.get("patient_id")))
+            }
+            if not oids:
+                return {}
+            cursor = patients_collection.find({"_id": {"$in": list(oids)}}, {"full_name": 1})
+            return {
+                str(p["_id"]): p.get("full_name", "Unknown Patient")
+                async for p in cursor
+            }
+
         # Get recent activities
         activities = []
         try:
-            recent_activities_cursor = bookings_collection.find(base_query).sort("updated_at", -1).limit(limit)
+            activity_rows = await bookings_collection.find(
+                base_query, _ACTIVITY_PROJECTION
+            ).sort("updated_at", -1).to_list(length=limit)
+            name_map = await _patient_names(activity_rows)
             
-            async for activity in recent_activities_cursor:
+            for activity in activity_rows:
                 try:
-                    patient_name = "Unknown Patient"
-                    patient_id = activity.get("patient_id")
-                    
-                    if patient_id:
-                        obj_id = safe_object_id_conversion(patient_id)
-                        if obj_id:
-                            patient = patients_collection.find_one({"_id": obj_id})
-                            if patient:
-                                patient_name = patient.get("full_name", "Unknown Patient")
+                    patient_name = name_map.get(str(activity.get("patient_id")), "Unknown Patient")
                     
                     status = activity.get("status", "unknown")
                     
-                    status_descriptions = {
-                        BookingStatus.PENDING: f"New booking created for {patient_name}",
-                        BookingStatus.APPROVED: f"Booking approved for {patient_name}",
-                        BookingStatus.SCHEDULED: f"Flight scheduled for {patient_name}",
-                        BookingStatus.EN_ROUTE: f"Transport en route for {patient_name}",
-                        BookingStatus.COMPLETED: f"Transport completed for {patient_name}",
-                        BookingStatus.CANCELLED: f"Booking cancelled for {patient_name}"
-                    }
-                    
-                    description = status_descriptions.get(status, f"Booking {status} for {patient_name}")
+                    tmpl = _STATUS_DESCRIPTIONS.get(status)
+                    description = tmpl.format(name=patient_name) if tmpl else f"Booking {status} for {patient_name}"
                     
                     activities.append({
                         "id": str(activity.get("_id", "")),
@@ -512,22 +560,15 @@ async def get_activity_transfers(
         # Get recent transfers
         transfers = []
         try:
-            recent_transfers_cursor = bookings_collection.find({
+            transfer_rows = await bookings_collection.find({
                 **base_query,
                 "status": BookingStatus.COMPLETED
-            }).sort("updated_at", -1).limit(10)
+            }, _ACTIVITY_PROJECTION).sort("updated_at", -1).to_list(length=10)
+            name_map = await _patient_names(transfer_rows)
             
-            async for transfer in recent_transfers_cursor:
+            for transfer in transfer_rows:
                 try:
-                    patient_name = "Unknown Patient"
-                    patient_id = transfer.get("patient_id")
-                    
-                    if patient_id:
-                        obj_id = safe_object_id_conversion(patient_id)
-                        if obj_id:
-                            patient = patients_collection.find_one({"_id": obj_id})
-                            if patient:
-                                patient_name = patient.get("full_name", "Unknown Patient")
+                    patient_name = name_map.get(str(transfer.get("patient_id")), "Unknown Patient")
                     
                     transfers.append({
                         "id": str(transfer.get("_id", "")),
@@ -568,8 +609,10 @@ async def get_activity_transfers(
 async def dashboard_health_check():
     """Health check for dashboard endpoints"""
     try:
-        bookings_collection = get_collection("bookings")
-        count = bookings_collection.count_documents({})
+        # Unfiltered total straight from collection metadata — O(1),
+        # unlike count_documents({}) which scans; the number is cosmetic
+        # so an estimate is fine for a probe hit every few seconds
+        count = await bookings_collection.estimated_document_count()
         return {
             "status": "healthy",
             "total_bookings": count,
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from database.connection import get_collection
+from database.connection import get_async_collection
 from models.hospital import HospitalStaff, StaffLogin
 from models.user import User, UserRole
 from utils.auth import get_password_hash, verify_password, create_access_token, decode_access_token
@@ -10,6 +10,9 @@ from bson import ObjectId
 
 router = APIRouter(prefix="/api/hospital-staff", tags=["Hospital Staff"])
 
+# Bound once at import — lifespan connects Mongo before routers load
+hospitals_collection = get_async_collection("hospitals")
+
 # Separate OAuth2 scheme for hospital staff login
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/hospital-staff/login")
 
@@ -21,8 +24,7 @@ async def get_current_hospital_staff(token: str = Depends(oauth2_scheme)):
     if not payload or payload.get("type") != "hospital_staff":
         raise HTTPException(status_code=403, detail="Only hospital staff can access this")
 
-    hospitals = get_collection("hospitals")
-    hospital = hospitals.find_one(
+    hospital = await hospitals_collection.find_one(
         {"_id": ObjectId(payload["hospital_id"])},
         {"staff": 1, "hospital_name": 1}
     )
@@ -55,8 +57,7 @@ async def add_hospital_staff(
     if not payload or payload.get("role") != UserRole.SUPERADMIN:
         raise HTTPException(status_code=403, detail="Only superadmin can add staff")
 
-    hospitals = get_collection("hospitals")
-    hospital = hospitals.find_one({"_id": ObjectId(hospital_id)})
+    hospital = await hospitals_collection.find_one({"_id": ObjectId(hospital_id)})
     if not hospital:
         raise HTTPException(status_code=404, detail="Hospital not found")
 
@@ -68,7 +69,7 @@ async def add_hospital_staff(
     staff_data["id"] = str(ObjectId())
     staff_data["password"] = get_password_hash(staff.password)
 
-    hospitals.update_one(
+    await hospitals_collection.update_one(
         {"_id": ObjectId(hospital_id)},
         {"$push": {"staff": staff_data}}
     )
@@ -81,9 +82,8 @@ async def add_hospital_staff(
 # ======================================================================
 @router.post("/login")
 async def hospital_staff_login(data: StaffLogin):
-    hospitals = get_collection("hospitals")
 
-    hospital = hospitals.find_one(
+    hospital = await hospitals_collection.find_one(
         {"staff.email": data.email},
         {"hospital_name": 1, "staff.$": 1}
     )
@@ -126,8 +126,7 @@ async def get_hospital_staff(
     hospital_id: str,
     token: str = Depends(oauth2_scheme)
 ):
-    hospitals = get_collection("hospitals")
-    hospital = hospitals.find_one({"_id": ObjectId(hospital_id)})
+    hospital = await hospitals_collection.find_one({"_id": ObjectId(hospital_id)})
 
     if not hospital:
         raise HTTPException(status_code=404, detail="Hospital not found")
@@ -148,8 +147,7 @@ async def delete_staff(
     if not payload or payload.get("role") != UserRole.SUPERADMIN:
         raise HTTPException(status_code=403, detail="Only superadmin can delete staff")
 
-    hospitals = get_collection("hospitals")
-    result = hospitals.update_one(
+    result = await hospitals_collection.update_one(
         {"_id": ObjectId(hospital_id)},
         {"$pull": {"staff": {"id": staff_id}}}
     )
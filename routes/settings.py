@@ -2,9 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List, Dict, Any
 from database.connection import get_collection
 from models.settings import (
-    UserSettings, UserSettingsCreate, UserSettingsUpdate, 
+    UserSettings, UserSettingsCreate, UserSettingsUpdate,
     SettingsResponse, NotificationPreferenceUpdate,
-    Theme, TimeFormat, DateFormat
+    Theme, TimeFormat, DateFormat,
+    FLAG_FIELDS, DEFAULT_FLAGS, pack_flags, unpack_flags
 )
 from models.user import User, UserRole
 from routes.auth import get_current_active_user
@@ -42,20 +43,22 @@ def get_default_settings(user_id: str) -> Dict[str, Any]:
         "date_format": DateFormat.MM_DD_YYYY,
         "timezone": "UTC",
         "language": "en",
-        "notifications_enabled": True,
-        "email_notifications": True,
-        "sms_notifications": False,
-        "push_notifications": True,
-        "browser_notifications": True,
-        "notify_booking_updates": True,
-        "notify_emergency_alerts": True,
-        "notify_system_maintenance": False,
-        "notify_promotions": False,
+        "flags": DEFAULT_FLAGS,
         "email_digest_frequency": "daily",
         "created_at": datetime.utcnow(),
         "updated_at": datetime.utcnow()
     }
 
+def settings_from_doc(settings_data: Dict[str, Any]) -> UserSettings:
+    """Hydrate a Mongo settings document into the API model"""
+    settings_data["id"] = str(settings_data["_id"])
+    flags = settings_data.get("flags")
+    if flags is not None:
+        # Expand the stored bitmask into the per-field booleans; documents
+        # written before the bitmask migration still carry the booleans
+        settings_data.update(unpack_flags(flags))
+    return UserSettings(**settings_data)
+
 @router.get("/", response_model=SettingsResponse)
 async def get_user_settings(current_user: Annotated[User, Depends(get_current_active_user)]):
     """Get user settings with user info and server time"""
@@ -73,8 +76,7 @@ async def get_user_settings(current_user: Annotated[User, Depends(get_current_ac
             settings_data = settings_collection.find_one({"_id": result.inserted_id})
         
         # Convert to UserSettings model
-        settings_data["id"] = str(settings_data["_id"])
-        user_settings = UserSettings(**settings_data)
+        user_settings = settings_from_doc(settings_data)
         
         # Get updated user data
         user_data = users_collection.find_one({"_id": ObjectId(current_user.id)})
@@ -114,20 +116,22 @@ async def create_user_settings(
         if existing_settings:
             raise HTTPException(status_code=400, detail="Settings already exist for this user")
         
-        # Create new settings
+        # Create new settings, packing the notification booleans into one int
         settings_dict = settings_data.dict()
+        settings_dict["flags"] = pack_flags(settings_dict)
+        for name in FLAG_FIELDS:
+            settings_dict.pop(name, None)
         settings_dict["user_id"] = str(current_user.id)
         settings_dict["created_at"] = datetime.utcnow()
         settings_dict["updated_at"] = datetime.utcnow()
-        
+
         result = settings_collection.insert_one(settings_dict)
-        
+
         # Return created settings
         created_settings = settings_collection.find_one({"_id": result.inserted_id})
-        created_settings["id"] = str(created_settings["_id"])
-        
+
         logger.info(f"Settings created for user {current_user.email}")
-        return UserSettings(**created_settings)
+        return settings_from_doc(created_settings)
     
     except HTTPException:
         raise
@@ -152,25 +156,34 @@ async def update_user_settings(
             result = settings_collection.insert_one(default_settings)
             current_settings = settings_collection.find_one({"_id": result.inserted_id})
         
-        # Prepare update data
-        update_data = {k: v for k, v in settings_update.dict().items() if v is not None}
+        # Prepare update data; notification booleans fold into the bitmask
+        update_data = settings_update.model_dump(exclude_unset=True, exclude_none=True)
+        changed = bits = 0
+        for i, name in enumerate(FLAG_FIELDS):
+            value = update_data.pop(name, None)
+            if value is not None:
+                changed |= 1 << i
+                if value:
+                    bits |= 1 << i
+        if changed:
+            old_flags = current_settings.get("flags", pack_flags(current_settings))
+            update_data["flags"] = (old_flags & ~changed) | bits
         update_data["updated_at"] = datetime.utcnow()
-        
+
         # Update settings
         result = settings_collection.update_one(
             {"user_id": str(current_user.id)},
             {"$set": update_data}
         )
-        
+
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="Settings not found or no changes made")
-        
+
         # Return updated settings
         updated_settings = settings_collection.find_one({"user_id": str(current_user.id)})
-        updated_settings["id"] = str(updated_settings["_id"])
-        
+
         logger.info(f"Settings updated for user {current_user.email}")
-        return UserSettings(**updated_settings)
+        return settings_from_doc(updated_settings)
     
     except HTTPException:
         raise
@@ -200,25 +213,29 @@ async def update_notification_preference(
             raise HTTPException(status_code=400, detail="Invalid notification type")
         
         field_name = notification_field_map[notification_type]
-        
-        # Update the specific notification setting
-        result = settings_collection.update_one(
+
+        # Documents written before the bitmask migration carry only the
+        # boolean fields; a blind $bit would seed their missing `flags`
+        # as 0 and wipe every other preference. Derive the current mask
+        # from whichever form the doc stores, then write the flipped
+        # value — same legacy fallback update_user_settings uses.
+        current_settings = settings_collection.find_one({"user_id": str(current_user.id)})
+        if not current_settings:
+            raise HTTPException(status_code=404, detail="Settings not found")
+
+        bit = 1 << FLAG_FIELDS.index(field_name)
+        old_flags = current_settings.get("flags", pack_flags(current_settings))
+        new_flags = old_flags | bit if preference_update.enabled else old_flags & ~bit
+        settings_collection.update_one(
             {"user_id": str(current_user.id)},
-            {"$set": {
-                field_name: preference_update.enabled,
-                "updated_at": datetime.utcnow()
-            }}
+            {"$set": {"flags": new_flags, "updated_at": datetime.utcnow()}}
         )
-        
-        if result.modified_count == 0:
-            raise HTTPException(status_code=404, detail="Settings not found")
-        
+
         # Return updated settings
         updated_settings = settings_collection.find_one({"user_id": str(current_user.id)})
-        updated_settings["id"] = str(updated_settings["_id"])
-        
+
         logger.info(f"Notification preference updated for user {current_user.email}: {notification_type} = {preference_update.enabled}")
-        return UserSettings(**updated_settings)
+        return settings_from_doc(updated_settings)
     
     except HTTPException:
         raise
@@ -250,10 +267,9 @@ async def update_theme(
             raise HTTPException(status_code=404, detail="Settings not found")
         
         updated_settings = settings_collection.find_one({"user_id": str(current_user.id)})
-        updated_settings["id"] = str(updated_settings["_id"])
-        
+
         logger.info(f"Theme updated for user {current_user.email}: {theme_name}")
-        return UserSettings(**updated_settings)
+        return settings_from_doc(updated_settings)
     
     except HTTPException:
         raise
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from pymongo import InsertOne
+
+from database.connection import get_async_collection
+
+try:
+    from utils.notifications import NotificationService
+except ImportError:
+    # Fallback mock service
+    class NotificationService:
+        @staticmethod
+        async def send_system_notification(users, title, message, notification_type="info"):
+            print(f"📢 MOCK SYSTEM: {title} - {message}")
+
+logger = logging.getLogger(__name__)
+
+# Coalesce whatever arrives within the flush window into one bulk write
+BATCH_SIZE = 50
+FLUSH_WINDOW = 0.05
+
+_queue: asyncio.Queue = asyncio.Queue()
+_worker_task: asyncio.Task = None
+
+
+def enqueue(users, title, message, notification_type="info"):
+    """Queue a system notification; delivery happens off the request path"""
+    _queue.put_nowait({
+        "users": users,
+        "title": title,
+        "message": message,
+        "notification_type": notification_type,
+        "created_at": datetime.utcnow(),
+    })
+
+
+async def _flush(batch):
+    # One unordered bulk insert persists the whole batch in a single
+    # round trip, then the external sends run without a request waiting
+    try:
+        notifications_collection = get_async_collection("notifications")
+        await notifications_collection.bulk_write(
+            [
+                InsertOne({
+                    "title": item["title"],
+                    "message": item["message"],
+                    "type": item["notification_type"],
+                    "recipient_ids": [str(user.id) for user in item["users"]],
+                    "created_at": item["created_at"],
+                })
+                for item in batch
+            ],
+            ordered=False,
+        )
+    except Exception as e:
+        logger.error(f"Error persisting notification batch: {e}")
+
+    for item in batch:
+        try:
+            await NotificationService.send_system_notification(
+                users=item["users"],
+                title=item["title"],
+                message=item["message"],
+                notification_type=item["notification_type"],
+            )
+        except Exception as e:
+            logger.error(f"Error delivering notification '{item['title']}': {e}")
+
+
+async def _worker():
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _queue.get()]
+        deadline = loop.time() + FLUSH_WINDOW
+        while len(batch) < BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        await _flush(batch)
+
+
+def start_worker():
+    global _worker_task
+    if _worker_task is None or _worker_task.done():
+        _worker_task = asyncio.create_task(_worker())
+
+
+async def stop_worker():
+    global _worker_task
+    if _worker_task is not None:
+        _worker_task.cancel()
+        _worker_task = None
+    # Drain anything still queued so shutdown doesn't drop notifications
+    remaining = []
+    while not _queue.empty():
+        remaining.append(_queue.get_nowait())
+    if remaining:
+        await _flush(remaining)